@@ -10,6 +10,7 @@ import collections.abc
 import inspect
 import types
 import typing
+import weakref
 from dataclasses import dataclass
 from typing import (
     Annotated,
@@ -39,7 +40,7 @@ from .decorators import Qualifier
 KeyT = Union[str, type]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DependencyRequest:
     """Describes a single dependency required by a constructor or method.
 
@@ -145,6 +146,26 @@ def analyze_callable_dependencies(callable_obj: Callable[..., Any]) -> Tuple[Dep
     return tuple(plan)
 
 
+_deps_cache: "weakref.WeakKeyDictionary[Any, Tuple[DependencyRequest, ...]]" = weakref.WeakKeyDictionary()
+
+
+def _analyze_cached(callable_obj: Callable[..., Any]) -> Tuple[DependencyRequest, ...]:
+    """Memoized :func:`analyze_callable_dependencies` for lifecycle methods.
+
+    Bound methods are keyed on their underlying function, so every instance
+    of a class shares one analysis of its ``@configure``/``@cleanup`` hooks.
+    """
+    fn = getattr(callable_obj, "__func__", callable_obj)
+    try:
+        deps = _deps_cache.get(fn)
+    except TypeError:
+        return analyze_callable_dependencies(callable_obj)
+    if deps is None:
+        deps = analyze_callable_dependencies(callable_obj)
+        _deps_cache[fn] = deps
+    return deps
+
+
 def _build_dep_request(name: str, param: inspect.Parameter, resolved_hints: Dict[str, Any]) -> DependencyRequest:
     ann = resolved_hints.get(name, param.annotation)
 
@@ -8,9 +8,11 @@ interception and lazy-loading transparently.
 
 import inspect
 import threading
+import weakref
 from typing import Any, Callable, Dict, List, Protocol, Tuple, Union
 
 from .constants import SCOPE_SINGLETON
+from .decorators import _has_function_marker, _method_names_where
 from .exceptions import AsyncResolutionError, SerializationError
 from .proxy_protocols import _ProxyProtocolMixin
 
@@ -34,13 +36,25 @@ class MethodCtx:
         container: The :class:`PicoContainer` that owns the component.
         local: Mutable dict for interceptor-to-interceptor communication.
         request_key: The active scope ID, if any (e.g. a request ID).
+        is_async: Whether the intercepted method is a coroutine function, so
+            ``call_next(ctx)`` returns an awaitable.
     """
 
-    __slots__ = ("instance", "cls", "method", "name", "args", "kwargs", "container", "local", "request_key")
+    __slots__ = (
+        "instance",
+        "cls",
+        "method",
+        "name",
+        "args",
+        "kwargs",
+        "container",
+        "request_key",
+        "is_async",
+        "_local",
+    )
 
     def __init__(
         self,
-        *,
         instance: object,
         cls: type,
         method: Callable[..., Any],
@@ -49,6 +63,7 @@ class MethodCtx:
         kwargs: dict,
         container: Any,
         request_key: Any = None,
+        is_async: bool = False,
     ):
         self.instance = instance
         self.cls = cls
@@ -57,8 +72,22 @@ class MethodCtx:
         self.args = args
         self.kwargs = kwargs
         self.container = container
-        self.local: Dict[str, Any] = {}
         self.request_key = request_key
+        self.is_async = is_async
+        self._local = None
+
+    # Most interceptors never touch ``local``, so the dict is only allocated
+    # on first access.
+    @property
+    def local(self) -> Dict[str, Any]:
+        local = self._local
+        if local is None:
+            local = self._local = {}
+        return local
+
+    @local.setter
+    def local(self, value: Dict[str, Any]) -> None:
+        self._local = value
 
 
 class MethodInterceptor(Protocol):
@@ -91,6 +120,29 @@ class ContainerObserver(Protocol):
     def on_cache_hit(self, key: KeyT): ...
 
 
+def _call_target(ctx: MethodCtx) -> Any:
+    return ctx.method(*ctx.args, **ctx.kwargs)
+
+
+def _link(invoke: Callable[[MethodCtx, Callable[[MethodCtx], Any]], Any], call_next: Callable[[MethodCtx], Any]):
+    def step(ctx: MethodCtx) -> Any:
+        return invoke(ctx, call_next)
+
+    return step
+
+
+def _compile_chain(interceptors: List["MethodInterceptor"]) -> Callable[[MethodCtx], Any]:
+    """Build the interceptor chain as nested ``call_next`` functions.
+
+    The result can be invoked for any number of calls, so callers that
+    keep the interceptor list build it once instead of once per call.
+    """
+    chain = _call_target
+    for interceptor in reversed(interceptors):
+        chain = _link(interceptor.invoke, chain)
+    return chain
+
+
 def dispatch_method(interceptors: List["MethodInterceptor"], ctx: MethodCtx) -> Any:
     """Execute an interceptor chain around a method call.
 
@@ -104,17 +156,7 @@ def dispatch_method(interceptors: List["MethodInterceptor"], ctx: MethodCtx) ->
     Returns:
         The return value of the (possibly intercepted) method call.
     """
-    idx = 0
-
-    def call_next(next_ctx: MethodCtx) -> Any:
-        nonlocal idx
-        if idx >= len(interceptors):
-            return next_ctx.method(*next_ctx.args, **next_ctx.kwargs)
-        interceptor = interceptors[idx]
-        idx += 1
-        return interceptor.invoke(next_ctx, call_next)
-
-    return call_next(ctx)
+    return _compile_chain(interceptors)(ctx)
 
 
 def intercepted_by(*interceptor_classes: type["MethodInterceptor"]):
@@ -150,24 +192,36 @@ def intercepted_by(*interceptor_classes: type["MethodInterceptor"]):
     def dec(fn):
         if not (inspect.isfunction(fn) or inspect.ismethod(fn) or inspect.iscoroutinefunction(fn)):
             raise TypeError("intercepted_by can only decorate callables")
-        existing = list(getattr(fn, "_pico_interceptors_", []))
-        for cls in interceptor_classes:
-            if cls not in existing:
-                existing.append(cls)
-        setattr(fn, "_pico_interceptors_", tuple(existing))
+        existing = getattr(fn, "_pico_interceptors_", ())
+        setattr(fn, "_pico_interceptors_", tuple(dict.fromkeys((*existing, *interceptor_classes))))
+        # Classified once here so neither the proxy nor interceptors need to
+        # inspect the function again on every call.
+        setattr(fn, "_pico_is_async_", inspect.iscoroutinefunction(fn))
         return fn
 
     return dec
 
 
-def _gather_interceptors_for_method(target_cls: type, name: str) -> Tuple[type, ...]:
+_interceptors_by_class: "weakref.WeakKeyDictionary[type, Dict[str, Tuple[type, ...]]]" = weakref.WeakKeyDictionary()
+
+
+def _intercepted_methods(target_cls: type) -> Dict[str, Tuple[type, ...]]:
+    """Map each intercepted method name on *target_cls* to its interceptor classes, built once per class."""
     try:
-        original = getattr(target_cls, name)
-    except AttributeError:
-        return ()
-    if inspect.ismethoddescriptor(original) or inspect.isbuiltin(original):
-        return ()
-    return tuple(getattr(original, "_pico_interceptors_", ()))
+        return _interceptors_by_class[target_cls]
+    except KeyError:
+        pass
+    by_name = {
+        name: tuple(getattr(getattr(target_cls, name), "_pico_interceptors_", ()))
+        for name in _method_names_where(target_cls, _has_function_marker, "_pico_interceptors_")
+    }
+    _interceptors_by_class[target_cls] = by_name
+    return by_name
+
+
+def _gather_interceptors_for_method(target_cls: type, name: str) -> Tuple[type, ...]:
+    """Interceptor classes attached to *name* on *target_cls*; ``()`` for anything that is not intercepted."""
+    return _intercepted_methods(target_cls).get(name, ())
 
 
 def health(fn):
@@ -199,6 +253,9 @@ def health(fn):
     return fn
 
 
+_PROXY_SLOTS = frozenset({"_target", "_creator", "_container", "_cache", "_lock", "_component_key"})
+
+
 class UnifiedComponentProxy(_ProxyProtocolMixin):
     """Transparent proxy for lazy initialisation and AOP interception.
 
@@ -266,7 +323,7 @@ class UnifiedComponentProxy(_ProxyProtocolMixin):
         # Target will be restored by pickle via __reduce_ex__ delegation
 
     def _get_real_object(self) -> Any:
-        tgt = object.__getattribute__(self, "_target")
+        tgt = self._target
         if tgt is not None:
             return tgt
 
@@ -298,7 +355,7 @@ class UnifiedComponentProxy(_ProxyProtocolMixin):
             return tgt
 
     async def _async_init_if_needed(self) -> None:
-        if object.__getattribute__(self, "_target") is not None:
+        if self._target is not None:
             return
 
         lock = object.__getattribute__(self, "_lock")
@@ -341,27 +398,20 @@ class UnifiedComponentProxy(_ProxyProtocolMixin):
 
     def _build_wrapped(self, name: str, bound: Callable[..., Any], interceptors_cls: Tuple[type, ...]):
         container = object.__getattribute__(self, "_container")
-        interceptors = [container.get(cls) for cls in interceptors_cls]
+        chain = _compile_chain([container.get(cls) for cls in interceptors_cls])
         sig = self._scope_signature()
         target = self._get_real_object()
-        original_func = bound
-        if hasattr(bound, "__func__"):
-            original_func = bound.__func__
+        target_cls = type(target)
+        request_key = sig[0] if sig else None
+        is_async = getattr(bound, "_pico_is_async_", None)
+        if is_async is None:
+            is_async = inspect.iscoroutinefunction(getattr(bound, "__func__", bound))
 
-        if inspect.iscoroutinefunction(original_func):
+        if is_async:
 
             async def aw(*args, **kwargs):
-                ctx = MethodCtx(
-                    instance=target,
-                    cls=type(target),
-                    method=bound,
-                    name=name,
-                    args=args,
-                    kwargs=kwargs,
-                    container=container,
-                    request_key=sig[0] if sig else None,
-                )
-                res = dispatch_method(interceptors, ctx)
+                ctx = MethodCtx(target, target_cls, bound, name, args, kwargs, container, request_key, True)
+                res = chain(ctx)
                 if inspect.isawaitable(res):
                     return await res
                 return res
@@ -370,17 +420,8 @@ class UnifiedComponentProxy(_ProxyProtocolMixin):
         else:
 
             def sw(*args, **kwargs):
-                ctx = MethodCtx(
-                    instance=target,
-                    cls=type(target),
-                    method=bound,
-                    name=name,
-                    args=args,
-                    kwargs=kwargs,
-                    container=container,
-                    request_key=sig[0] if sig else None,
-                )
-                res = dispatch_method(interceptors, ctx)
+                ctx = MethodCtx(target, target_cls, bound, name, args, kwargs, container, request_key)
+                res = chain(ctx)
                 if inspect.isawaitable(res):
                     raise RuntimeError(f"Async interceptor returned awaitable on sync method: {name}")
                 return res
@@ -392,6 +433,10 @@ class UnifiedComponentProxy(_ProxyProtocolMixin):
         return self._get_real_object().__class__
 
     def __getattr__(self, name: str) -> Any:
+        if name in _PROXY_SLOTS:
+            # An unset slot of the proxy itself; never delegate (that would
+            # recurse through _get_real_object).
+            raise AttributeError(name)
         target = self._get_real_object()
         attr = getattr(target, name)
         if not callable(attr):
@@ -400,7 +445,9 @@ class UnifiedComponentProxy(_ProxyProtocolMixin):
         interceptors_cls = _gather_interceptors_for_method(type(target), name)
         if not interceptors_cls:
             return attr
+        return self._intercepted(name, attr, interceptors_cls)
 
+    def _intercepted(self, name: str, attr: Callable[..., Any], interceptors_cls: Tuple[type, ...]):
         lock = object.__getattribute__(self, "_lock")
         with lock:
             cache: Dict[str, Tuple[Tuple[Any, ...], Callable[..., Any], Tuple[type, ...]]] = object.__getattribute__(
@@ -420,10 +467,56 @@ class UnifiedComponentProxy(_ProxyProtocolMixin):
             return wrapped
 
     def __setattr__(self, name, value):
-        if name in ("_target", "_creator", "_container", "_cache", "_lock", "_component_key"):
+        if name in _PROXY_SLOTS:
             object.__setattr__(self, name, value)
         else:
             setattr(self._get_real_object(), name, value)
 
     def __delattr__(self, name):
         delattr(self._get_real_object(), name)
+
+
+class _InterceptedMethod:
+    """Class-level accessor for one intercepted method of a generated proxy class.
+
+    Found by normal attribute lookup, so access skips the failed lookup,
+    the ``__getattr__`` call and the per-access interceptor scan.
+    """
+
+    __slots__ = ("_name", "_interceptors")
+
+    def __init__(self, name: str, interceptors: Tuple[type, ...]):
+        self._name = name
+        self._interceptors = interceptors
+
+    def __get__(self, proxy, owner=None):
+        if proxy is None:
+            return self
+        name = self._name
+        attr = getattr(proxy._get_real_object(), name)
+        if not callable(attr):
+            return attr
+        return proxy._intercepted(name, attr, self._interceptors)
+
+
+_proxy_classes: "weakref.WeakKeyDictionary[type, type]" = weakref.WeakKeyDictionary()
+
+
+def _proxy_class_for(target_cls: type) -> type:
+    """Return the :class:`UnifiedComponentProxy` subclass for *target_cls*, built once per class.
+
+    Each intercepted method gets an :class:`_InterceptedMethod` accessor; every
+    other attribute still goes through ``UnifiedComponentProxy.__getattr__``.
+    Names the proxy defines itself never reach ``__getattr__`` and are left as is.
+    """
+    try:
+        return _proxy_classes[target_cls]
+    except KeyError:
+        pass
+    ns: Dict[str, Any] = {"__slots__": (), "__module__": __name__}
+    for name, interceptors_cls in _intercepted_methods(target_cls).items():
+        if interceptors_cls and not hasattr(UnifiedComponentProxy, name):
+            ns[name] = _InterceptedMethod(name, interceptors_cls)
+    proxy_cls = type(f"UnifiedComponentProxy[{target_cls.__qualname__}]", (UnifiedComponentProxy,), ns)
+    _proxy_classes[target_cls] = proxy_cls
+    return proxy_cls
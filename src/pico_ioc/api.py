@@ -166,9 +166,7 @@ def _create_container(active, environ, logger, config, custom_scopes, custom_sca
 
 def _apply_overrides(factory, overrides):
     if overrides:
-        for k, v in overrides.items():
-            prov, _ = _normalize_override_provider(v)
-            factory.bind(k, prov)
+        factory.bind_many({k: _normalize_override_provider(v)[0] for k, v in overrides.items()})
 
 
 def _wire_and_resolve(pico, registrar, validate_only):
@@ -195,20 +193,20 @@ def _validate_profiles(active: Tuple[str, ...], allowed_profiles: Optional[Itera
 
 
 def _eagerly_resolve_singletons(pico: PicoContainer, locator: ComponentLocator) -> None:
+    # Eager singletons share one cache, so the cached check skips `get()` (and
+    # its cache-hit observer notification) for keys already built as a dependency.
+    eager_keys = tuple(k for k, md in locator._metadata.items() if md.scope == SCOPE_SINGLETON and not md.lazy)
+    if not eager_keys:
+        return
+    cached = pico._cache_for(eager_keys[0]).get
+    get = pico.get
     eager_singletons = []
-    for key, md in locator._metadata.items():
-        if md.scope == SCOPE_SINGLETON and not md.lazy:
-            cache = pico._cache_for(key)
-            instance = cache.get(key)
-            if instance is None:
-                instance = pico.get(key)
-            eager_singletons.append(instance)
-
-    configure_awaitables = []
-    for instance in eager_singletons:
-        res = pico._run_configure_methods(instance)
-        if inspect.isawaitable(res):
-            configure_awaitables.append(res)
+    for key in eager_keys:
+        instance = cached(key)
+        eager_singletons.append(get(key) if instance is None else instance)
+
+    run_configure = pico._run_configure_methods
+    configure_awaitables = [res for res in map(run_configure, eager_singletons) if inspect.isawaitable(res)]
 
     if configure_awaitables:
         raise ConfigurationError(
@@ -220,34 +218,33 @@ def _eagerly_resolve_singletons(pico: PicoContainer, locator: ComponentLocator)
 
 
 def _find_cycle(graph: Dict[KeyT, Tuple[KeyT, ...]]) -> Optional[Tuple[KeyT, ...]]:
-    temp: Set[KeyT] = set()
-    perm: Set[KeyT] = set()
-    stack: List[KeyT] = []
-
-    def visit(n: KeyT) -> Optional[Tuple[KeyT, ...]]:
-        if n in perm:
-            return None
-        if n in temp:
-            try:
-                idx = stack.index(n)
-                return tuple(stack[idx:] + [n])
-            except ValueError:
-                return tuple([n, n])
-        temp.add(n)
-        stack.append(n)
-        for m in graph.get(n, ()):
-            c = visit(m)
-            if c:
-                return c
-        stack.pop()
-        temp.remove(n)
-        perm.add(n)
-        return None
-
-    for node in graph.keys():
-        c = visit(node)
-        if c:
-            return c
+    # Iterative DFS: the current path is only sliced into a tuple when a
+    # back edge is actually found, so acyclic graphs pay no tracing cost.
+    done: Set[KeyT] = set()
+    end = object()
+
+    for root in graph:
+        if root in done:
+            continue
+        path: List[KeyT] = [root]
+        on_path: Dict[KeyT, int] = {root: 0}
+        pending = [iter(graph.get(root, ()))]
+        while pending:
+            child = next(pending[-1], end)
+            if child is end:
+                pending.pop()
+                node = path.pop()
+                del on_path[node]
+                done.add(node)
+                continue
+            if child in done:
+                continue
+            idx = on_path.get(child)
+            if idx is not None:
+                return tuple(path[idx:]) + (child,)
+            on_path[child] = len(path)
+            path.append(child)
+            pending.append(iter(graph.get(child, ())))
     return None
 
 
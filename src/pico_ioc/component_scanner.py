@@ -7,6 +7,7 @@ walks modules and registers decorated classes and functions).
 
 import inspect
 import os
+from types import FunctionType
 from typing import Any, Callable, Dict, List, Optional, Protocol, Set, Tuple, Union
 
 from .analysis import DependencyRequest, analyze_callable_dependencies
@@ -72,13 +73,13 @@ class ComponentScanner:
         if not c:
             return True
 
-        p = set(c.get("profiles") or ())
-        if p and not (p & self._profiles):
+        p = c.get("profiles")
+        if p and self._profiles.isdisjoint(p):
             return False
 
-        req = c.get("require_env") or ()
-        for k in req:
-            if k not in self._environ or not self._environ.get(k):
+        environ = self._environ
+        for k in c.get("require_env") or ():
+            if not environ.get(k):
                 return False
 
         pred = c.get("predicate")
@@ -98,8 +99,9 @@ class ComponentScanner:
         if not self._enabled_by_condition(cls):
             return
         key = getattr(cls, PICO_KEY, cls)
-        qset = set(str(q) for q in getattr(cls, PICO_META, {}).get("qualifier", ()))
-        sc = getattr(cls, PICO_META, {}).get("scope", SCOPE_SINGLETON)
+        meta = getattr(cls, PICO_META, {})
+        qset = set(meta.get("qualifier", ()))
+        sc = meta.get("scope", SCOPE_SINGLETON)
         deps = analyze_callable_dependencies(cls.__init__)
         provider = DeferredProvider(lambda pico, loc, c=cls, d=deps: pico.build_class(c, loc, d))
         md = ProviderMetadata(
@@ -109,8 +111,8 @@ class ComponentScanner:
             factory_class=None,
             factory_method=None,
             qualifiers=qset,
-            primary=bool(getattr(cls, PICO_META, {}).get("primary")),
-            lazy=bool(getattr(cls, PICO_META, {}).get("lazy", False)),
+            primary=bool(meta.get("primary")),
+            lazy=bool(meta.get("lazy", False)),
             infra=getattr(cls, PICO_INFRA, None),
             pico_name=getattr(cls, PICO_NAME, None),
             scope=sc,
@@ -122,7 +124,11 @@ class ComponentScanner:
         if not self._enabled_by_condition(cls):
             return
 
-        factory_deps = self._detect_factory_deps(cls)
+        # Constructor deps are analysed on the first instance @provides member,
+        # in the same pass that discovers it.
+        factory_deps: Optional[Tuple[DependencyRequest, ...]] = None
+        cls_scope = getattr(cls, PICO_META, {}).get("scope", SCOPE_SINGLETON)
+        infra = getattr(cls, PICO_INFRA, None)
 
         for name in dir(cls):
             fn, kind = self._resolve_provides_member(cls, name)
@@ -144,8 +150,9 @@ class ComponentScanner:
                 provider = DeferredProvider(lambda pico, loc, f=fn, d=deps: pico.build_method(f, loc, d))
 
             rt = get_return_type(fn)
-            qset = set(str(q) for q in getattr(fn, PICO_META, {}).get("qualifier", ()))
-            sc = getattr(fn, PICO_META, {}).get("scope", getattr(cls, PICO_META, {}).get("scope", SCOPE_SINGLETON))
+            meta = getattr(fn, PICO_META, {})
+            qset = set(meta.get("qualifier", ()))
+            sc = meta.get("scope", cls_scope)
             md = ProviderMetadata(
                 key=k,
                 provided_type=rt if isinstance(rt, type) else (k if isinstance(k, type) else None),
@@ -153,25 +160,15 @@ class ComponentScanner:
                 factory_class=cls,
                 factory_method=name,
                 qualifiers=qset,
-                primary=bool(getattr(fn, PICO_META, {}).get("primary")),
-                lazy=bool(getattr(fn, PICO_META, {}).get("lazy", False)),
-                infra=getattr(cls, PICO_INFRA, None),
+                primary=bool(meta.get("primary")),
+                lazy=bool(meta.get("lazy", False)),
+                infra=infra,
                 pico_name=getattr(fn, PICO_NAME, None),
                 scope=sc,
                 dependencies=deps,
             )
             self._queue(k, provider, md)
 
-    def _detect_factory_deps(self, cls: type) -> Optional[Tuple[DependencyRequest, ...]]:
-        for name in dir(cls):
-            try:
-                raw = inspect.getattr_static(cls, name)
-                if inspect.isfunction(raw) and getattr(raw, PICO_INFRA, None) == "provides":
-                    return analyze_callable_dependencies(cls.__init__)
-            except Exception:
-                continue
-        return None
-
     def _resolve_provides_member(self, cls: type, name: str) -> Tuple[Optional[Callable], Optional[str]]:
         try:
             raw = inspect.getattr_static(cls, name)
@@ -182,7 +179,7 @@ class ComponentScanner:
             fn, kind = raw.__func__, "static"
         elif isinstance(raw, classmethod):
             fn, kind = raw.__func__, "class"
-        elif inspect.isfunction(raw):
+        elif isinstance(raw, FunctionType):
             fn, kind = raw, "instance"
         else:
             return None, None
@@ -200,8 +197,9 @@ class ComponentScanner:
         deps = analyze_callable_dependencies(fn)
         provider = DeferredProvider(lambda pico, loc, f=fn, d=deps: pico.build_method(f, loc, d))
         rt = get_return_type(fn)
-        qset = set(str(q) for q in getattr(fn, PICO_META, {}).get("qualifier", ()))
-        sc = getattr(fn, PICO_META, {}).get("scope", SCOPE_SINGLETON)
+        meta = getattr(fn, PICO_META, {})
+        qset = set(meta.get("qualifier", ()))
+        sc = meta.get("scope", SCOPE_SINGLETON)
         md = ProviderMetadata(
             key=k,
             provided_type=rt if isinstance(rt, type) else (k if isinstance(k, type) else None),
@@ -209,8 +207,8 @@ class ComponentScanner:
             factory_class=None,
             factory_method=getattr(fn, "__name__", None),
             qualifiers=qset,
-            primary=bool(getattr(fn, PICO_META, {}).get("primary")),
-            lazy=bool(getattr(fn, PICO_META, {}).get("lazy", False)),
+            primary=bool(meta.get("primary")),
+            lazy=bool(meta.get("lazy", False)),
             infra="provides",
             pico_name=getattr(fn, PICO_NAME, None),
             scope=sc,
@@ -232,23 +230,25 @@ class ComponentScanner:
         return False
 
     def scan_module(self, module: Any) -> None:
+        # Custom scanners are rare; don't probe them for every module member.
+        has_custom = bool(self._custom_scanners)
         for _, obj in inspect.getmembers(module):
-            if self._try_custom_scanners(obj):
+            if has_custom and self._try_custom_scanners(obj):
                 continue
 
-            if inspect.isclass(obj):
+            if isinstance(obj, type):
                 self._scan_class(obj)
-            elif inspect.isfunction(obj):
+            elif isinstance(obj, FunctionType):
                 if getattr(obj, PICO_INFRA, None) == "provides":
                     self._register_provides_function(obj)
 
     def _scan_class(self, obj: type) -> None:
         meta = getattr(obj, PICO_META, {})
 
-        if "on_missing" in meta:
-            sel = meta["on_missing"]["selector"]
-            pr = int(meta["on_missing"].get("priority", 0))
-            self._on_missing.append((pr, sel, obj))
+        om = meta.get("on_missing")
+        if om is not None:
+            # The decorator already stores the priority as an int.
+            self._on_missing.append((om.get("priority", 0), om["selector"], obj))
             return
 
         infra = getattr(obj, PICO_INFRA, None)
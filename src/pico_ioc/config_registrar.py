@@ -194,7 +194,7 @@ class ConfigurationManager:
         if mapping == "flat" and not is_dataclass(target):
             raise ConfigurationError(f"Target class {target.__name__} for flat mapping must be a dataclass")
 
-        qset = set(str(q) for q in meta.get("qualifier", ()))
+        qset = set(meta.get("qualifier", ()))
         sc = meta.get("scope", SCOPE_SINGLETON)
 
         graph_builder = self._graph
@@ -244,7 +244,7 @@ class ConfigurationManager:
         if md.infra != "configured":
             return False
 
-        target_type = md.provided_type or md.concrete_class
+        target_type = md.effective_type
         if not isinstance(target_type, type):
             return False
 
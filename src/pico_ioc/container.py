@@ -11,36 +11,62 @@ import inspect
 import secrets
 import threading
 import time
+import weakref
 from contextlib import contextmanager
 from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union, overload
 
-from .analysis import DependencyRequest, analyze_callable_dependencies
+from .analysis import DependencyRequest, _analyze_cached, analyze_callable_dependencies
 from .aop import ContainerObserver, UnifiedComponentProxy
-from .constants import LOGGER, PICO_META, SCOPE_SINGLETON
-from .container_resolution import _ResolutionMixin
+from .constants import LOGGER, SCOPE_PROTOTYPE, SCOPE_SINGLETON
+from .container_resolution import _is_awaitable, _ResolutionMixin
+from .decorators import _marked_method_names
 from .exceptions import AsyncResolutionError, ComponentCreationError, ProviderNotFoundError
 from .factory import ComponentFactory
 from .graph_export import _build_resolution_graph
 from .graph_export import export_graph as _export_graph
-from .locator import ComponentLocator
+from .locator import ComponentLocator, _is_subclass
 from .scope import ScopedCaches, ScopeManager
 
 KeyT = Union[str, type]
 
+_CONTAINER_ID: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("pico_container_id", default=None)
+# Weak values: a container that is dropped without shutdown() must not be
+# kept alive (with all of its singletons) by the registry.
+_REGISTRY: "weakref.WeakValueDictionary[str, PicoContainer]" = weakref.WeakValueDictionary()
+
+_perf_counter = time.perf_counter
+_wall_time = time.time
+# event_bus imports api, which imports this module: bind it on first use.
+_event_bus: Any = None
+
+
+def _event_bus_module() -> Any:
+    global _event_bus
+    if _event_bus is None:
+        from . import event_bus as _event_bus
+    return _event_bus
+
+
+_configure_plans: "weakref.WeakKeyDictionary[type, Tuple[Tuple[str, ...], bool]]" = weakref.WeakKeyDictionary()
+
+
+def _configure_plan(cls: type) -> Tuple[Tuple[str, ...], bool]:
+    """Return ``(configure method names, any of them async)`` for *cls*, cached per class."""
+    plan = _configure_plans.get(cls)
+    if plan is None:
+        names = _marked_method_names(cls, "configure")
+        plan = (names, any(inspect.iscoroutinefunction(getattr(cls, n, None)) for n in names))
+        _configure_plans[cls] = plan
+    return plan
+
 
 def _needs_async_configure(obj: Any) -> bool:
-    for _, m in inspect.getmembers(obj, predicate=inspect.ismethod):
-        meta = getattr(m, PICO_META, {})
-        if meta.get("configure", False) and inspect.iscoroutinefunction(m):
-            return True
-    return False
+    return _configure_plan(obj.__class__)[1]
 
 
 def _iter_configure_methods(obj: Any):
-    for _, m in inspect.getmembers(obj, predicate=inspect.ismethod):
-        meta = getattr(m, PICO_META, {})
-        if meta.get("configure", False):
-            yield m
+    for name in _configure_plan(obj.__class__)[0]:
+        yield getattr(obj, name)
 
 
 class PicoContainer(_ResolutionMixin):
@@ -60,10 +86,12 @@ class PicoContainer(_ResolutionMixin):
         profiles: Active profile names.
     """
 
-    _container_id_var: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("pico_container_id", default=None)
-    _container_registry: Dict[str, "PicoContainer"] = {}
+    _container_id_var: contextvars.ContextVar[Optional[str]] = _CONTAINER_ID
+    _container_registry: "weakref.WeakValueDictionary[str, PicoContainer]" = _REGISTRY
 
     class _Ctx:
+        __slots__ = ("container_id", "profiles", "created_at", "resolve_count", "cache_hit_count")
+
         def __init__(self, container_id: str, profiles: Tuple[str, ...], created_at: float) -> None:
             self.container_id = container_id
             self.profiles = profiles
@@ -84,13 +112,17 @@ class PicoContainer(_ResolutionMixin):
         self._caches = caches
         self.scopes = scopes
         self._locator: Optional[ComponentLocator] = None
+        self._canonical_cache: Dict[KeyT, KeyT] = {}
+        self._key_scope_cache: Dict[KeyT, Tuple[str, Any]] = {}
+        self._singletons = caches.for_scope(scopes, SCOPE_SINGLETON)
         self._config_manager: Optional[Any] = None
         self._observers = list(observers or [])
+        self._has_observers = bool(self._observers)
         self._shutdown_guard = threading.Lock()
         self._is_shut_down = False
         self.container_id = container_id or self._generate_container_id()
-        self.context = PicoContainer._Ctx(container_id=self.container_id, profiles=profiles, created_at=time.time())
-        PicoContainer._container_registry[self.container_id] = self
+        self.context = PicoContainer._Ctx(container_id=self.container_id, profiles=profiles, created_at=_wall_time())
+        _REGISTRY[self.container_id] = self
 
     @staticmethod
     def _generate_container_id() -> str:
@@ -99,24 +131,26 @@ class PicoContainer(_ResolutionMixin):
     @classmethod
     def get_current(cls) -> Optional["PicoContainer"]:
         """Return the container that is active in the current context, or ``None``."""
-        cid = cls._container_id_var.get()
-        return cls._container_registry.get(cid) if cid else None
+        cid = _CONTAINER_ID.get()
+        return _REGISTRY.get(cid) if cid else None
 
     @classmethod
     def get_current_id(cls) -> Optional[str]:
         """Return the container ID that is active in the current context, or ``None``."""
-        return cls._container_id_var.get()
+        return _CONTAINER_ID.get()
 
     @classmethod
     def all_containers(cls) -> Dict[str, "PicoContainer"]:
         """Return a snapshot dict of all live containers, keyed by container ID."""
-        return dict(cls._container_registry)
+        # items() walks the weak dict once under its iteration guard; dict(_REGISTRY)
+        # would go through keys() plus a weakref dereference per __getitem__.
+        return dict(_REGISTRY.items())
 
     def activate(self) -> contextvars.Token:
-        return PicoContainer._container_id_var.set(self.container_id)
+        return _CONTAINER_ID.set(self.container_id)
 
     def deactivate(self, token: contextvars.Token) -> None:
-        PicoContainer._container_id_var.reset(token)
+        _CONTAINER_ID.reset(token)
 
     @contextmanager
     def as_current(self):
@@ -128,6 +162,8 @@ class PicoContainer(_ResolutionMixin):
 
     def attach_locator(self, locator: ComponentLocator) -> None:
         self._locator = locator
+        self._canonical_cache.clear()
+        self._key_scope_cache.clear()
 
     def attach_config_manager(self, config_manager: Any) -> None:
         self._config_manager = config_manager
@@ -138,19 +174,28 @@ class PicoContainer(_ResolutionMixin):
         Returns the changed top-level prefixes. Already-created components keep
         their old config; subscribers to ``ConfigChanged`` re-read what they need.
         """
-        from .event_bus import ConfigChanged, EventBus
-
         if self._config_manager is None:
             return frozenset()
         changed = self._config_manager.refresh()
-        if changed and self.has(EventBus):
-            self.get(EventBus).publish_sync(ConfigChanged(prefixes=changed))
+        bus = _event_bus_module()
+        if changed and self.has(bus.EventBus):
+            self.get(bus.EventBus).publish_sync(bus.ConfigChanged(prefixes=changed))
         return changed
 
-    def _cache_for(self, key: KeyT):
+    def _scope_and_cache(self, key: KeyT) -> Tuple[str, Any]:
+        slot = self._key_scope_cache.get(key)
+        if slot is not None:
+            return slot
         md = self._locator._metadata.get(key) if self._locator else None
         sc = md.scope if md else SCOPE_SINGLETON
-        return self._caches.for_scope(self.scopes, sc)
+        slot = (sc, self._caches.for_scope(self.scopes, sc))
+        # Singleton and prototype caches never depend on the active scope id.
+        if md is not None and sc in (SCOPE_SINGLETON, SCOPE_PROTOTYPE):
+            self._key_scope_cache[key] = slot
+        return slot
+
+    def _cache_for(self, key: KeyT):
+        return self._scope_and_cache(key)[1]
 
     def has(self, key: KeyT) -> bool:
         """Check whether a component is registered for *key*.
@@ -169,66 +214,74 @@ class PicoContainer(_ResolutionMixin):
         if self._factory.has(key):
             return key
 
-        if isinstance(key, type) and self._locator:
-            cands: List[Tuple[bool, Any]] = []
-            for k, md in self._locator._metadata.items():
-                typ = md.provided_type or md.concrete_class
-                if not isinstance(typ, type):
-                    continue
-                try:
-                    if typ is not key and issubclass(typ, key):
-                        cands.append((md.primary, k))
-                except Exception:
-                    continue
-            if cands:
-                prim = [k for is_p, k in cands if is_p]
-                return prim[0] if prim else cands[0][1]
-
-        if isinstance(key, str) and self._locator:
-            for k, md in self._locator._metadata.items():
-                if md.pico_name == key:
-                    return k
+        if self._locator is None or not isinstance(key, (type, str)):
+            return key
 
-        return key
+        resolved = self._canonical_cache.get(key)
+        if resolved is None:
+            resolved = self._find_type_key(key) if isinstance(key, type) else self._find_name_key(key)
+            self._canonical_cache[key] = resolved
+        return resolved
+
+    def _find_name_key(self, key: str) -> KeyT:
+        mapped = self._locator.key_for_pico_name(key)
+        return key if mapped is None else mapped
+
+    def _find_type_key(self, key: type) -> KeyT:
+        md_by_key = self._locator._metadata
+        first: Optional[KeyT] = None
+        for k in self._locator.subtype_keys(key):
+            md = md_by_key[k]
+            if md.effective_type is key:
+                continue
+            if md.primary:
+                return k
+            if first is None:
+                first = k
+        return key if first is None else first
+
+    def _record_cache_hit(self, key: KeyT) -> None:
+        self.context.cache_hit_count += 1
+        if self._has_observers:
+            for o in self._observers:
+                o.on_cache_hit(key)
 
-    def _resolve_or_create_internal(self, key: KeyT) -> Tuple[Any, float, bool, KeyT]:
+    def _resolve_or_create_internal(self, key: KeyT) -> Tuple[Any, float, bool, KeyT, str, Any]:
         key = self._canonical_key(key)
-        cache = self._cache_for(key)
+        scope, cache = self._scope_and_cache(key)
         cached = cache.get(key)
 
         if cached is not None:
-            self.context.cache_hit_count += 1
-            for o in self._observers:
-                o.on_cache_hit(key)
-            return cached, 0.0, True, key
-
-        t0 = time.perf_counter()
+            self._record_cache_hit(key)
+            return cached, 0.0, True, key, scope, cache
 
-        token_container = self.activate()
-        requester = None
+        # Timing only feeds observers; skip the clock reads when nobody listens.
+        t0 = _perf_counter() if self._has_observers else None
+        provider = self._factory.get(key, origin=None)
 
+        # Nested resolutions run with this container already current; only the
+        # outermost one needs to set (and later reset) the context variable.
+        token_container = None if _CONTAINER_ID.get() == self.container_id else _CONTAINER_ID.set(self.container_id)
         try:
-            provider = self._factory.get(key, origin=requester)
-            try:
-                instance_or_awaitable = provider()
-            except ProviderNotFoundError:
-                raise
-            except Exception as creation_error:
-                raise ComponentCreationError(key, creation_error) from creation_error
-
-            took_ms = (time.perf_counter() - t0) * 1000
-            return instance_or_awaitable, took_ms, False, key
-
+            instance_or_awaitable = provider()
+        except ProviderNotFoundError:
+            raise
+        except Exception as creation_error:
+            raise ComponentCreationError(key, creation_error) from creation_error
         finally:
-            self.deactivate(token_container)
+            if token_container is not None:
+                _CONTAINER_ID.reset(token_container)
+
+        took_ms = (_perf_counter() - t0) * 1000 if t0 is not None else 0.0
+        return instance_or_awaitable, took_ms, False, key, scope, cache
 
     def _run_configure_methods(self, instance: Any) -> Any:
         if not _needs_async_configure(instance):
             for m in _iter_configure_methods(instance):
-                configure_deps = analyze_callable_dependencies(m)
+                configure_deps = _analyze_cached(m)
                 args = self._resolve_args(configure_deps)
                 res = m(**args)
-                if inspect.isawaitable(res):
+                if _is_awaitable(res):
                     raise AsyncResolutionError(
                         f"Component {type(instance).__name__} returned an awaitable from synchronous "
                         f"@configure method '{m.__name__}'. You must use 'await container.aget()' "
@@ -238,10 +291,10 @@ class PicoContainer(_ResolutionMixin):
 
         async def runner():
             for m in _iter_configure_methods(instance):
-                configure_deps = analyze_callable_dependencies(m)
+                configure_deps = _analyze_cached(m)
                 args = self._resolve_args(configure_deps)
                 r = m(**args)
-                if inspect.isawaitable(r):
+                if _is_awaitable(r):
                     await r
             return instance
 
@@ -266,31 +319,36 @@ class PicoContainer(_ResolutionMixin):
                 (use :meth:`aget` instead).
             ComponentCreationError: If the provider fails during creation.
         """
-        instance_or_awaitable, took_ms, was_cached, key = self._resolve_or_create_internal(key)
+        # Registered keys are their own canonical key, so a resolved singleton
+        # can be served before any canonicalization or scope dispatch.
+        cached = self._singletons.get(key)
+        if cached is not None:
+            self._record_cache_hit(key)
+            return cached
+
+        instance_or_awaitable, took_ms, was_cached, key, scope, cache = self._resolve_or_create_internal(key)
 
         if was_cached:
             return instance_or_awaitable
 
         instance = instance_or_awaitable
-        # isawaitable on a lazy proxy touches __class__ and would materialize
-        # it synchronously; proxies are never awaitables, so skip the check.
-        if not isinstance(instance, UnifiedComponentProxy) and inspect.isawaitable(instance):
+        # _is_awaitable only looks at type(instance), so a lazy proxy is not
+        # materialized by the check.
+        if _is_awaitable(instance):
             raise AsyncResolutionError(key)
 
-        md = self._locator._metadata.get(key) if self._locator else None
-        scope = md.scope if md else SCOPE_SINGLETON
         if scope != SCOPE_SINGLETON:
             instance_or_awaitable_configured = self._run_configure_methods(instance)
-            if inspect.isawaitable(instance_or_awaitable_configured):
+            if _is_awaitable(instance_or_awaitable_configured):
                 raise AsyncResolutionError(key)
             instance = instance_or_awaitable_configured
 
         final_instance = self._maybe_wrap_with_aspects(key, instance)
-        cache = self._cache_for(key)
         cache.put(key, final_instance)
         self.context.resolve_count += 1
-        for o in self._observers:
-            o.on_resolve(key, took_ms)
+        if self._has_observers:
+            for o in self._observers:
+                o.on_resolve(key, took_ms)
 
         return final_instance
 
@@ -311,7 +369,14 @@ class PicoContainer(_ResolutionMixin):
             ProviderNotFoundError: If no provider is bound to *key*.
             ComponentCreationError: If the provider fails during creation.
         """
-        instance_or_awaitable, took_ms, was_cached, key = self._resolve_or_create_internal(key)
+        cached = self._singletons.get(key)
+        if cached is not None:
+            self._record_cache_hit(key)
+            if isinstance(cached, UnifiedComponentProxy):
+                await cached._async_init_if_needed()
+            return cached
+
+        instance_or_awaitable, took_ms, was_cached, key, scope, cache = self._resolve_or_create_internal(key)
 
         instance = instance_or_awaitable
         if was_cached:
@@ -319,14 +384,12 @@ class PicoContainer(_ResolutionMixin):
                 await instance._async_init_if_needed()
             return instance
 
-        if not isinstance(instance, UnifiedComponentProxy) and inspect.isawaitable(instance_or_awaitable):
+        if _is_awaitable(instance_or_awaitable):
             instance = await instance_or_awaitable
 
-        md = self._locator._metadata.get(key) if self._locator else None
-        scope = md.scope if md else SCOPE_SINGLETON
         if scope != SCOPE_SINGLETON:
             instance_or_awaitable_configured = self._run_configure_methods(instance)
-            if inspect.isawaitable(instance_or_awaitable_configured):
+            if _is_awaitable(instance_or_awaitable_configured):
                 instance = await instance_or_awaitable_configured
             else:
                 instance = instance_or_awaitable_configured
@@ -336,16 +399,24 @@ class PicoContainer(_ResolutionMixin):
         if isinstance(final_instance, UnifiedComponentProxy):
             await final_instance._async_init_if_needed()
 
-        cache = self._cache_for(key)
         cache.put(key, final_instance)
         self.context.resolve_count += 1
-        for o in self._observers:
-            o.on_resolve(key, took_ms)
+        if self._has_observers:
+            for o in self._observers:
+                o.on_resolve(key, took_ms)
 
         return final_instance
 
-    def _iterate_cleanup_targets(self) -> Iterable[Any]:
-        yield from (obj for _, obj in self._caches.all_items())
+    def _iterate_cleanup_targets(self) -> Iterable[Tuple[Any, Tuple[str, ...]]]:
+        """Yield ``(object, @cleanup method names)`` once per object that has any."""
+        seen_ids = set()
+        for _, obj in self._caches.all_items():
+            if id(obj) in seen_ids:
+                continue
+            seen_ids.add(id(obj))
+            names = _marked_method_names(obj.__class__, "cleanup")
+            if names:
+                yield obj, names
 
         if self._locator:
             seen = set()
@@ -353,39 +424,42 @@ class PicoContainer(_ResolutionMixin):
                 fc = md.factory_class
                 if fc and fc not in seen:
                     seen.add(fc)
+                    # Only factories that declare @cleanup methods are worth
+                    # resolving (or constructing) at shutdown.
+                    names = _marked_method_names(fc, "cleanup")
+                    if not names:
+                        continue
                     inst = self.get(fc) if self._factory.has(fc) else fc()
-                    yield inst
+                    if id(inst) not in seen_ids:
+                        seen_ids.add(id(inst))
+                        yield inst, names
 
     def _call_cleanup_method(self, method: Callable[..., Any]) -> Any:
-        deps_requests = analyze_callable_dependencies(method)
+        deps_requests = _analyze_cached(method)
         return method(**self._resolve_args(deps_requests))
 
     def cleanup_all(self) -> None:
         """Invoke all ``@cleanup`` methods on cached components (sync)."""
-        for obj in self._iterate_cleanup_targets():
-            for _, m in inspect.getmembers(obj, predicate=inspect.ismethod):
-                meta = getattr(m, PICO_META, {})
-                if meta.get("cleanup", False):
-                    res = self._call_cleanup_method(m)
-                    if inspect.isawaitable(res):
-                        LOGGER.warning(f"Async cleanup method {m} called during sync shutdown. Awaitable ignored.")
+        for obj, names in self._iterate_cleanup_targets():
+            for name in names:
+                m = getattr(obj, name)
+                res = self._call_cleanup_method(m)
+                if _is_awaitable(res):
+                    LOGGER.warning(f"Async cleanup method {m} called during sync shutdown. Awaitable ignored.")
 
     async def cleanup_all_async(self) -> None:
         """Invoke all ``@cleanup`` methods on cached components (async).
 
         Awaits async cleanup methods and closes the :class:`EventBus` if present.
         """
-        for obj in self._iterate_cleanup_targets():
-            for _, m in inspect.getmembers(obj, predicate=inspect.ismethod):
-                meta = getattr(m, PICO_META, {})
-                if meta.get("cleanup", False):
-                    res = self._call_cleanup_method(m)
-                    if inspect.isawaitable(res):
-                        await res
+        for obj, names in self._iterate_cleanup_targets():
+            for name in names:
+                res = self._call_cleanup_method(getattr(obj, name))
+                if _is_awaitable(res):
+                    await res
 
         try:
-            from .event_bus import EventBus
-
+            EventBus = _event_bus_module().EventBus
             for _, obj in self._caches.all_items():
                 if isinstance(obj, EventBus):
                     await obj.aclose()
@@ -437,12 +511,11 @@ class PicoContainer(_ResolutionMixin):
         """
         out: Dict[str, bool] = {}
         for k, obj in self._caches.all_items():
-            for name, m in inspect.getmembers(obj, predicate=callable):
-                if getattr(m, PICO_META, {}).get("health_check", False):
-                    try:
-                        out[f"{getattr(k, '__name__', k)}.{name}"] = bool(m())
-                    except Exception:
-                        out[f"{getattr(k, '__name__', k)}.{name}"] = False
+            for name in _marked_method_names(obj.__class__, "health_check"):
+                try:
+                    out[f"{getattr(k, '__name__', k)}.{name}"] = bool(getattr(obj, name)())
+                except Exception:
+                    out[f"{getattr(k, '__name__', k)}.{name}"] = False
         return out
 
     def stats(self) -> Dict[str, Any]:
@@ -453,13 +526,14 @@ class PicoContainer(_ResolutionMixin):
             ``uptime_seconds``, ``total_resolves``, ``cache_hits``,
             ``cache_hit_rate``, and ``registered_components``.
         """
-        resolves = self.context.resolve_count
-        hits = self.context.cache_hit_count
+        ctx = self.context
+        resolves = ctx.resolve_count
+        hits = ctx.cache_hit_count
         total = resolves + hits
         return {
             "container_id": self.container_id,
-            "profiles": self.context.profiles,
-            "uptime_seconds": time.time() - self.context.created_at,
+            "profiles": ctx.profiles,
+            "uptime_seconds": _wall_time() - ctx.created_at,
             "total_resolves": resolves,
             "cache_hits": hits,
             "cache_hit_rate": (hits / total) if total > 0 else 0.0,
@@ -476,6 +550,11 @@ class PicoContainer(_ResolutionMixin):
             self._is_shut_down = True
             return True
 
+    def _unregister(self) -> None:
+        # The registry is weak, but a shut-down container that is still
+        # referenced must stop being reported by get_current()/all_containers().
+        _REGISTRY.pop(self.container_id, None)
+
     def shutdown(self) -> None:
         """Synchronously shut down the container.
 
@@ -486,7 +565,7 @@ class PicoContainer(_ResolutionMixin):
         if not self._begin_shutdown():
             return
         self.cleanup_all()
-        PicoContainer._container_registry.pop(self.container_id, None)
+        self._unregister()
 
     async def ashutdown(self) -> None:
         """Asynchronously shut down the container.
@@ -498,7 +577,7 @@ class PicoContainer(_ResolutionMixin):
         if not self._begin_shutdown():
             return
         await self.cleanup_all_async()
-        PicoContainer._container_registry.pop(self.container_id, None)
+        self._unregister()
 
     def build_resolution_graph(self):
         """Build the static dependency graph from registered metadata.
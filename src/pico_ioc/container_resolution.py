@@ -1,11 +1,57 @@
 import inspect
+import types
+import weakref
 from typing import Any, Callable, Dict, Tuple, Type, Union
 
-from .analysis import DependencyRequest, analyze_callable_dependencies
-from .aop import UnifiedComponentProxy
+from .analysis import DependencyRequest, _analyze_cached, analyze_callable_dependencies
+from .aop import UnifiedComponentProxy, _proxy_class_for
+from .decorators import _has_function_marker, _method_names_where
+from .exceptions import ProviderNotFoundError
 
 KeyT = Union[str, type]
 
+_CoroutineType = types.CoroutineType
+_GeneratorType = types.GeneratorType
+
+
+def _is_awaitable(obj: Any) -> bool:
+    """Equivalent of :func:`inspect.isawaitable` that only inspects ``type(obj)``.
+
+    Avoids the ``collections.abc.Awaitable`` ``isinstance`` machinery and never
+    touches ``obj.__class__``, so lazy proxies are not materialized.
+    """
+    t = type(obj)
+    if t is _CoroutineType:
+        return True
+    if t is _GeneratorType:
+        return bool(obj.gi_code.co_flags & inspect.CO_ITERABLE_COROUTINE)
+    return getattr(t, "__await__", None) is not None
+
+
+def _has_interceptors(cls: type) -> bool:
+    return bool(_method_names_where(cls, _has_function_marker, "_pico_interceptors_"))
+
+
+_async_init_classes: "weakref.WeakKeyDictionary[type, bool]" = weakref.WeakKeyDictionary()
+
+
+def _has_async_init(cls: type) -> bool:
+    """Whether *cls* defines an ``async def __ainit__``, cached per class."""
+    try:
+        return _async_init_classes[cls]
+    except KeyError:
+        pass
+    ainit = getattr(cls, "__ainit__", None)
+    found = callable(ainit) and inspect.iscoroutinefunction(ainit)
+    _async_init_classes[cls] = found
+    return found
+
+
+def _instance_async_init(inst: Any) -> Any:
+    """An ``async def __ainit__`` assigned on *inst* itself, which the per-class cache cannot see."""
+    ainit = getattr(inst, "__dict__", {}).get("__ainit__")
+    return ainit if callable(ainit) and inspect.iscoroutinefunction(ainit) else None
+
 
 class _ResolutionMixin:
     def _resolve_args(self, dependencies: Tuple[DependencyRequest, ...]) -> Dict[str, Any]:
@@ -13,20 +59,23 @@ class _ResolutionMixin:
         if not dependencies or self._locator is None:
             return kwargs
 
+        # Plain single dependencies dominate; bind their resolver once per call.
+        resolve_single = self._resolve_single_dep
         for dep in dependencies:
             if dep.is_list:
                 self._resolve_list_dep(dep, kwargs)
             elif dep.is_dict:
                 self._resolve_dict_dep(dep, kwargs)
             else:
-                self._resolve_single_dep(dep, kwargs)
+                resolve_single(dep, kwargs)
         return kwargs
 
     def _resolve_list_dep(self, dep: DependencyRequest, kwargs: Dict[str, Any]) -> None:
         keys: Tuple[KeyT, ...] = ()
         if isinstance(dep.key, type):
             keys = tuple(self._locator.collect_by_type(dep.key, dep.qualifier))
-        kwargs[dep.parameter_name] = [self.get(k) for k in keys]
+        get = self.get
+        kwargs[dep.parameter_name] = [get(k) for k in keys]
 
     def _resolve_dict_dep(self, dep: DependencyRequest, kwargs: Dict[str, Any]) -> None:
         value_type = dep.key
@@ -37,9 +86,11 @@ class _ResolutionMixin:
         if isinstance(value_type, type):
             keys_to_resolve = tuple(self._locator.collect_by_type(value_type, dep.qualifier))
 
+        get = self.get
+        metadata = self._locator._metadata
         for comp_key in keys_to_resolve:
-            instance = self.get(comp_key)
-            md = self._locator._metadata.get(comp_key)
+            instance = get(comp_key)
+            md = metadata.get(comp_key)
             if md is None:
                 continue
 
@@ -68,30 +119,39 @@ class _ResolutionMixin:
             mapped = self._locator.find_key_by_name(primary_key)
             primary_key = mapped if mapped is not None else primary_key
 
+        # A directly bound key is settled by one factory lookup; only other
+        # keys (interfaces, pico names, cached instances) need the full has().
+        # Both lookups stay inside the fallback so optional deps still get
+        # their default when has()/get() raise (e.g. a scope that is not active).
+        name = dep.parameter_name
+        factory_has = self._factory.has
+        first_error = None
         try:
-            kwargs[dep.parameter_name] = self.get(primary_key)
-        except Exception as first_error:
-            if primary_key != dep.parameter_name:
-                try:
-                    kwargs[dep.parameter_name] = self.get(dep.parameter_name)
-                    return
-                except Exception:
-                    pass
-            # Optional dependencies (param has a default OR T | None annotation)
-            # fall back to the function's default by leaving kwargs unset.
-            if dep.is_optional:
+            if factory_has(primary_key) or self.has(primary_key):
+                kwargs[name] = self.get(primary_key)
                 return
+        except Exception as e:
+            first_error = e
+        if primary_key != name:
+            try:
+                if factory_has(name) or self.has(name):
+                    kwargs[name] = self.get(name)
+                    return
+            except Exception:
+                pass
+        # Optional dependencies (param has a default OR T | None annotation)
+        # fall back to the function's default by leaving kwargs unset.
+        if dep.is_optional:
+            return
+        if first_error is not None:
             raise first_error from None
+        raise ProviderNotFoundError(primary_key)
 
     def _maybe_wrap_with_aspects(self, key, instance: Any) -> Any:
         if isinstance(instance, UnifiedComponentProxy):
             return instance
-        cls = type(instance)
-        for _, fn in inspect.getmembers(
-            cls, predicate=lambda m: inspect.isfunction(m) or inspect.ismethod(m) or inspect.iscoroutinefunction(m)
-        ):
-            if getattr(fn, "_pico_interceptors_", None):
-                return UnifiedComponentProxy(container=self, target=instance, component_key=key)
+        if _has_interceptors(type(instance)):
+            return _proxy_class_for(type(instance))(container=self, target=instance, component_key=key)
         return instance
 
     def build_class(self, cls: type, locator: Any, dependencies: Tuple[DependencyRequest, ...]) -> Any:
@@ -102,22 +162,19 @@ class _ResolutionMixin:
             deps = self._resolve_args(dependencies)
             inst = cls(**deps)
 
-        ainit = getattr(inst, "__ainit__", None)
-        has_async = callable(ainit) and inspect.iscoroutinefunction(ainit)
-
-        if has_async:
+        ainit = inst.__ainit__ if _has_async_init(type(inst)) else _instance_async_init(inst)
+        if ainit is not None:
 
             async def runner():
-                if callable(ainit):
+                kwargs = {}
+                try:
+                    ainit_deps = _analyze_cached(ainit)
+                    kwargs = self._resolve_args(ainit_deps)
+                except Exception:
                     kwargs = {}
-                    try:
-                        ainit_deps = analyze_callable_dependencies(ainit)
-                        kwargs = self._resolve_args(ainit_deps)
-                    except Exception:
-                        kwargs = {}
-                    res = ainit(**kwargs)
-                    if inspect.isawaitable(res):
-                        await res
+                res = ainit(**kwargs)
+                if _is_awaitable(res):
+                    await res
                 return inst
 
             return runner()
@@ -125,6 +182,6 @@ class _ResolutionMixin:
         return inst
 
     def build_method(self, fn: Callable[..., Any], locator: Any, dependencies: Tuple[DependencyRequest, ...]) -> Any:
-        deps = self._resolve_args(dependencies)
-        obj = fn(**deps)
-        return obj
+        if not dependencies:
+            return fn()
+        return fn(**self._resolve_args(dependencies))
@@ -7,8 +7,9 @@ for discovery by the pico-ioc container: :func:`component`, :func:`factory`,
 
 import inspect
 import typing
+import weakref
 from dataclasses import MISSING
-from typing import Any, Callable, Dict, Iterable, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
 
 from .constants import PICO_INFRA, PICO_KEY, PICO_META, PICO_NAME
 
@@ -21,6 +22,58 @@ def _meta_get(obj: Any) -> Dict[str, Any]:
     return m
 
 
+def _effective_attrs(cls: type) -> Iterator[Tuple[str, Any]]:
+    """Yield ``(name, function)`` for each class attribute that wins lookup on *cls*.
+
+    Walks the class dicts along ``cls.__mro__`` (so overrides are honoured and
+    properties are never evaluated) and unwraps static/class methods.
+    """
+    seen = set()
+    for base in getattr(cls, "__mro__", (cls,)):
+        for name, raw in vars(base).items():
+            if name not in seen:
+                seen.add(name)
+                yield name, getattr(raw, "__func__", raw)
+
+
+def _has_meta_flag(fn: Any, tag: str) -> bool:
+    return inspect.isfunction(fn) and bool(getattr(fn, PICO_META, {}).get(tag, False))
+
+
+def _has_marker(fn: Any, attr: str) -> bool:
+    return bool(getattr(fn, attr, None))
+
+
+def _has_function_marker(fn: Any, attr: str) -> bool:
+    return inspect.isfunction(fn) and bool(getattr(fn, attr, None))
+
+
+_method_names_cache: "weakref.WeakKeyDictionary[type, Dict[Tuple[Callable[[Any, str], bool], str], Tuple[str, ...]]]" = weakref.WeakKeyDictionary()
+
+
+def _method_names_where(cls: type, predicate: Callable[[Any, str], bool], arg: str) -> Tuple[str, ...]:
+    """Sorted names of the methods of *cls* for which ``predicate(fn, arg)`` holds.
+
+    Computed once per class, predicate and argument via :func:`_effective_attrs`.
+    """
+    try:
+        per_cls = _method_names_cache[cls]
+    except KeyError:
+        per_cls = _method_names_cache[cls] = {}
+    except TypeError:
+        per_cls = {}
+    key = (predicate, arg)
+    names = per_cls.get(key)
+    if names is None:
+        names = per_cls[key] = tuple(sorted(name for name, fn in _effective_attrs(cls) if predicate(fn, arg)))
+    return names
+
+
+def _marked_method_names(cls: type, tag: str) -> Tuple[str, ...]:
+    """Names of the methods of *cls* whose ``_pico_meta`` sets *tag* (e.g. ``"cleanup"``)."""
+    return _method_names_where(cls, _has_meta_flag, tag)
+
+
 def _apply_common_metadata(
     obj: Any,
     *,
@@ -47,8 +100,8 @@ def _apply_common_metadata(
 
     if has_conditional:
         m["conditional"] = {
-            "profiles": tuple(p for p in conditional_profiles or ()),
-            "require_env": tuple(e for e in conditional_require_env or ()),
+            "profiles": tuple(conditional_profiles or ()),
+            "require_env": tuple(conditional_require_env or ()),
             "predicate": conditional_predicate,
         }
 
@@ -402,11 +455,21 @@ def configured(target: Any = "self", *, prefix: str = "", mapping: str = "auto",
     return dec
 
 
+def _remember_return_type(fn: Callable[..., Any], rt: Optional[type]) -> Optional[type]:
+    try:
+        setattr(fn, "_pico_return_type", rt)
+    except (AttributeError, TypeError):
+        pass
+    return rt
+
+
 def get_return_type(fn: Callable[..., Any]) -> Optional[type]:
     """Extract the concrete return type from a callable's annotations.
 
-    Uses ``typing.get_type_hints`` with ``include_extras=True`` to resolve
-    PEP 563 deferred annotations, falling back to ``inspect.signature``.
+    A plain class annotation is read directly; anything else (PEP 563 strings,
+    ``Annotated``) is resolved with ``typing.get_type_hints`` using
+    ``include_extras=True``, falling back to ``inspect.signature``. Resolved
+    results are cached on the callable.
 
     Args:
         fn: The callable to inspect.
@@ -414,14 +477,23 @@ def get_return_type(fn: Callable[..., Any]) -> Optional[type]:
     Returns:
         The return type if it is a concrete class, otherwise ``None``.
     """
+    cached = getattr(fn, "_pico_return_type", MISSING)
+    if cached is not MISSING:
+        return cached
+    annotations = getattr(fn, "__annotations__", None)
+    if isinstance(annotations, dict):
+        if "return" not in annotations:
+            return None
+        if isinstance(annotations["return"], type):
+            return _remember_return_type(fn, annotations["return"])
     try:
         hints = typing.get_type_hints(fn, include_extras=True)
         ra = hints.get("return")
     except Exception:
+        # Unresolvable (e.g. forward) references may resolve later: no caching.
         try:
             ra = inspect.signature(fn).return_annotation
         except Exception:
             return None
-    if ra is None or ra is inspect._empty:
-        return None
-    return ra if isinstance(ra, type) else None
+        return ra if isinstance(ra, type) and ra is not inspect._empty else None
+    return _remember_return_type(fn, ra if isinstance(ra, type) else None)
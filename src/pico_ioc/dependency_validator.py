@@ -1,9 +1,10 @@
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
+from functools import cache
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
 from .analysis import DependencyRequest
 from .exceptions import InvalidBindingError
 from .factory import ComponentFactory, ProviderMetadata
-from .locator import ComponentLocator
+from .locator import ComponentLocator, _is_subclass
 
 KeyT = Union[str, type]
 
@@ -12,14 +13,30 @@ def _fmt(k: KeyT) -> str:
     return getattr(k, "__name__", str(k))
 
 
+_SKIP_TYPES = frozenset({str, int, float, bool, bytes, Any})
+
+
+@cache
+def _is_protocol(t: type) -> bool:
+    # A missing attribute costs a full MRO walk per getattr, and validation
+    # asks about the same few types over and over; validate_bindings clears
+    # the cache when it finishes so no types are retained.
+    return bool(getattr(t, "_is_protocol", False))
+
+
 def _skip_type(t: type) -> bool:
-    if t in (str, int, float, bool, bytes):
-        return True
-    if t is Any:
-        return True
-    if getattr(t, "_is_protocol", False):
-        return True
-    return False
+    return t in _SKIP_TYPES or _is_protocol(t)
+
+
+def _prefer_primary(mds: Iterable[ProviderMetadata]) -> Optional[ProviderMetadata]:
+    # Single pass: the first primary wins outright, otherwise the first seen.
+    first: Optional[ProviderMetadata] = None
+    for md in mds:
+        if md.primary:
+            return md
+        if first is None:
+            first = md
+    return first
 
 
 class DependencyValidator:
@@ -27,60 +44,62 @@ class DependencyValidator:
         self._metadata = metadata
         self._factory = factory
         self._locator = locator
+        self._names: Optional[Set[Any]] = None
 
     def _find_md_for_type(self, t: type) -> Optional[ProviderMetadata]:
-        cands: List[ProviderMetadata] = []
+        if type(t) is type:
+            # Plain classes are answered from the locator's reverse MRO index,
+            # built once per validation run, instead of a scan per dependency.
+            metadata = self._metadata
+            md = _prefer_primary(metadata[k] for k in self._locator.subtype_keys(t) if k in metadata)
+        else:
+            md = _prefer_primary(self._matching_mds(lambda typ: _is_subclass(typ, t)))
+        if md is None and _is_protocol(t):
+            md = _prefer_primary(self._matching_mds(lambda typ: ComponentLocator._implements_protocol(typ, t)))
+        return md
+
+    def _matching_mds(self, matches: Callable[[type], bool]) -> Iterator[ProviderMetadata]:
         for md in self._metadata.values():
-            typ = md.provided_type or md.concrete_class
+            typ = md.effective_type
             if not isinstance(typ, type):
                 continue
             try:
-                if issubclass(typ, t):
-                    cands.append(md)
-            except TypeError:
-                pass
+                ok = matches(typ)
             except Exception:
                 continue
-        if not cands:
-            if getattr(t, "_is_protocol", False):
-                for md in self._metadata.values():
-                    typ = md.provided_type or md.concrete_class
-                    if isinstance(typ, type) and ComponentLocator._implements_protocol(typ, t):
-                        cands.append(md)
-
-        if not cands:
-            return None
-        prim = [m for m in cands if m.primary]
-        return prim[0] if prim else cands[0]
-
-    def _find_md_for_name(self, name: str) -> Optional[KeyT]:
-        return self._locator.find_key_by_name(name)
+            if ok:
+                yield md
 
     def validate_bindings(self) -> None:
-        errors: List[str] = []
-
-        for k, md in self._metadata.items():
-            if self._should_skip_component(md):
-                continue
-
-            loc_name = f"factory method {md.factory_method}" if md.factory_method else f"component {_fmt(k)}"
-
-            for dep in md.dependencies:
-                error = self._validate_dependency(k, dep, loc_name)
-                if error:
-                    errors.append(error)
+        # Insertion-ordered set: a component that asks for the same missing key
+        # through several parameters reports it once.
+        errors: Dict[str, None] = {}
+
+        try:
+            for k, md in self._metadata.items():
+                if not md.skip_validation:
+                    self._validate_component(k, md, errors)
+        finally:
+            _is_protocol.cache_clear()
+            self._names = None
 
         if errors:
-            raise InvalidBindingError(errors)
-
-    def _should_skip_component(self, md: ProviderMetadata) -> bool:
-        if md.infra == "configuration":
-            return True
-        if not md.dependencies and md.infra not in ("configured", "component") and not md.override:
-            return True
-        if md.infra == "component" and md.concrete_class and md.concrete_class.__init__ is object.__init__:
-            return True
-        return False
+            raise InvalidBindingError(list(errors))
+
+    def _validate_component(self, k: KeyT, md: ProviderMetadata, errors: Dict[str, None]) -> None:
+        loc_name = None
+        for dep in md.dependencies:
+            # Optional and primitive/protocol dependencies never produce an
+            # error; filter them here without a dispatch call.
+            if dep.is_optional:
+                continue
+            if not dep.is_list and isinstance(dep.key, type) and _skip_type(dep.key):
+                continue
+            if loc_name is None:
+                loc_name = f"factory method {md.factory_method}" if md.factory_method else f"component {_fmt(k)}"
+            error = self._validate_dependency(k, dep, loc_name)
+            if error:
+                errors[error] = None
 
     def _validate_dependency(self, k: KeyT, dep: DependencyRequest, loc_name: str) -> Optional[str]:
         if dep.is_optional:
@@ -100,26 +119,43 @@ class DependencyValidator:
     def _validate_list_dep(self, k: KeyT, dep: DependencyRequest, loc_name: str) -> Optional[str]:
         if not dep.qualifier:
             return None
+        dep_key = dep.key
         if (
-            not self._locator.collect_by_type(dep.key, dep.qualifier)
-            and isinstance(dep.key, type)
-            and not _skip_type(dep.key)
+            isinstance(dep_key, type)
+            and not _skip_type(dep_key)
+            and not self._locator.collect_by_type(dep_key, dep.qualifier)
         ):
             return f"{_fmt(k)} ({loc_name}) expects List[{_fmt(dep.key)}] with qualifier '{dep.qualifier}' but no matching components exist"
         return None
 
+    def _known_names(self) -> Set[Any]:
+        # Pico names and provided type names -- the same matches as
+        # find_key_by_name -- gathered once per validation run. Raw metadata
+        # keys are left out so a string key never satisfies a type dependency.
+        names = self._names
+        if names is None:
+            names = set()
+            for md in self._metadata.values():
+                try:
+                    names.add(md.pico_name)
+                except TypeError:
+                    pass
+                typ = md.effective_type
+                if isinstance(typ, type):
+                    names.add(typ.__name__)
+            self._names = names
+        return names
+
     def _validate_str_dep(self, k: KeyT, dep_key: str, loc_name: str) -> Optional[str]:
-        key_found_by_name = self._find_md_for_name(dep_key)
-        directly_bound = dep_key in self._metadata or self._factory.has(dep_key)
-        if not key_found_by_name and not directly_bound:
-            return f"{_fmt(k)} ({loc_name}) depends on string key '{dep_key}' which is not bound"
-        return None
+        if dep_key in self._metadata or dep_key in self._known_names() or self._factory.has(dep_key):
+            return None
+        return f"{_fmt(k)} ({loc_name}) depends on string key '{dep_key}' which is not bound"
 
     def _validate_type_dep(self, k: KeyT, dep_key: type, loc_name: str) -> Optional[str]:
         if self._factory.has(dep_key) or dep_key in self._metadata:
             return None
         if self._find_md_for_type(dep_key) is not None:
             return None
-        if self._find_md_for_name(getattr(dep_key, "__name__", "")) is not None:
+        if getattr(dep_key, "__name__", "") in self._known_names():
             return None
         return f"{_fmt(k)} ({loc_name}) depends on {_fmt(dep_key)} which is not bound"
@@ -15,6 +15,7 @@ from enum import Enum, auto
 from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple, Type
 
 from .api import cleanup, configure, factory, provides
+from .decorators import _has_marker, _method_names_where
 from .exceptions import EventBusClosedError, EventBusError, EventBusHandlerError, EventBusQueueFullError
 
 log = logging.getLogger(__name__)
@@ -70,7 +71,7 @@ class ConfigChanged(Event):
     prefixes: frozenset
 
 
-@dataclass(order=True)
+@dataclass(order=True, slots=True)
 class _Subscriber:
     sort_index: int = field(init=False, repr=False, compare=True)
     priority: int = field(compare=False)
@@ -302,6 +303,11 @@ def subscribe(
     return dec
 
 
+def _subscribed_method_names(cls: type) -> Tuple[str, ...]:
+    """Sorted names of the ``@subscribe``-decorated methods of *cls*, cached per class."""
+    return _method_names_where(cls, _has_marker, "_pico_subscriptions_")
+
+
 class AutoSubscriberMixin:
     """Mixin that auto-subscribes ``@subscribe``-decorated methods to the EventBus.
 
@@ -312,7 +318,8 @@ class AutoSubscriberMixin:
 
     @configure
     def _pico_autosubscribe(self, event_bus: EventBus) -> None:
-        for _, attr in inspect.getmembers(self, predicate=callable):
+        for name in _subscribed_method_names(type(self)):
+            attr = getattr(self, name)
             subs: Iterable[Tuple[Type[Event], int, ExecPolicy, bool]] = getattr(attr, "_pico_subscriptions_", ())
             for evt_t, pr, pol, once in subs:
                 event_bus.subscribe(evt_t, attr, priority=pr, policy=pol, once=once)
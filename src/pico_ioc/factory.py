@@ -6,8 +6,8 @@ and :class:`DeferredProvider` (a provider whose resolution is deferred until
 the container and locator are available).
 """
 
-from dataclasses import dataclass
-from typing import Any, Callable, Dict, Optional, Set, Tuple, Union
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Mapping, Optional, Set, Tuple, Union
 
 from .analysis import DependencyRequest
 from .exceptions import ProviderNotFoundError
@@ -16,7 +16,7 @@ KeyT = Union[str, type]
 Provider = Callable[[], Any]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProviderMetadata:
     """Immutable descriptor for a registered provider.
 
@@ -40,6 +40,10 @@ class ProviderMetadata:
             dependencies.
         override: Whether this provider was registered via ``overrides``.
         scope: Lifecycle scope name.
+        effective_type: ``provided_type or concrete_class``, computed once at
+            construction for type-matching scans.
+        skip_validation: Whether binding validation has nothing to check for
+            this provider, computed once at construction.
     """
 
     key: KeyT
@@ -55,6 +59,24 @@ class ProviderMetadata:
     dependencies: Tuple[DependencyRequest, ...] = ()
     override: bool = False
     scope: str = "singleton"
+    effective_type: Optional[type] = field(init=False, repr=False, compare=False)
+    skip_validation: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "effective_type", self.provided_type or self.concrete_class)
+        object.__setattr__(self, "skip_validation", _skips_validation(self))
+
+
+def _skips_validation(md: ProviderMetadata) -> bool:
+    # Configuration classes, dependency-free non-component providers and
+    # components with the default constructor have no bindings to validate.
+    if md.infra == "configuration":
+        return True
+    if not md.dependencies and md.infra not in ("configured", "component") and not md.override:
+        return True
+    if md.infra == "component" and md.concrete_class and md.concrete_class.__init__ is object.__init__:
+        return True
+    return False
 
 
 class ComponentFactory:
@@ -77,6 +99,15 @@ class ComponentFactory:
         """
         self._providers[key] = provider
 
+    def bind_many(self, providers: Mapping[KeyT, Provider]) -> None:
+        """Bind several providers at once, replacing any previous bindings.
+
+        Args:
+            providers: Mapping of resolution keys to zero-argument provider
+                callables.
+        """
+        self._providers.update(providers)
+
     def has(self, key: KeyT) -> bool:
         """Check whether a provider is bound to *key*.
 
@@ -101,9 +132,10 @@ class ComponentFactory:
         Raises:
             ProviderNotFoundError: If no provider is bound to *key*.
         """
-        if key not in self._providers:
+        provider = self._providers.get(key)
+        if provider is None:
             raise ProviderNotFoundError(key, origin)
-        return self._providers[key]
+        return provider
 
 
 class DeferredProvider:
@@ -1,5 +1,7 @@
 from typing import Any, Dict, List, Optional, Tuple, Union
 
+from .locator import _is_subclass
+
 KeyT = Union[str, type]
 
 
@@ -8,7 +10,7 @@ def _build_resolution_graph(loc) -> Dict[KeyT, Tuple[KeyT, ...]]:
         return {}
 
     graph: Dict[KeyT, Tuple[KeyT, ...]] = {}
-    for key, md in list(loc._metadata.items()):
+    for key, md in loc._metadata.items():
         deps: List[KeyT] = []
         for d in loc.dependency_keys_for_static(md):
             deps.append(_map_dep_to_bound_key(loc, d))
@@ -32,11 +34,11 @@ def _map_dep_to_bound_key(loc, dep_key: KeyT) -> KeyT:
 
 def _find_subtype_key(loc, dep_key: type) -> KeyT:
     for k, md in loc._metadata.items():
-        typ = md.provided_type or md.concrete_class
+        typ = md.effective_type
         if not isinstance(typ, type):
             continue
         try:
-            if issubclass(typ, dep_key):
+            if _is_subclass(typ, dep_key):
                 return k
         except Exception:
             continue
@@ -58,16 +60,15 @@ def export_graph(
     md_by_key = locator._metadata
     graph = _build_resolution_graph(locator)
 
-    lines: List[str] = []
-    lines.append("digraph Pico {")
-    lines.append(f'  rankdir="{rankdir}";')
-    lines.append("  node [shape=box, fontsize=10];")
-    if title:
-        lines.append('  labelloc="t";')
-        lines.append(f'  label="{title}";')
+    # Sequential ids are collision-free and stable for a given registration
+    # order; unbound dependency keys get the next free id on first sight.
+    ids: Dict[KeyT, str] = {k: f"n{i}" for i, k in enumerate(md_by_key)}
 
     def _node_id(k: KeyT) -> str:
-        return f"n_{abs(hash(k))}"
+        nid = ids.get(k)
+        if nid is None:
+            nid = ids[k] = f"n{len(ids)}"
+        return nid
 
     def _node_label(k: KeyT) -> str:
         name = getattr(k, "__name__", str(k))
@@ -80,18 +81,21 @@ def export_graph(
             parts.append(f"\\n⟨{q}⟩")
         return "\\n".join(parts)
 
-    for key in md_by_key.keys():
-        nid = _node_id(key)
-        label = _node_label(key)
-        lines.append(f'  {nid} [label="{label}"];')
+    header = f'digraph Pico {{\n  rankdir="{rankdir}";\n  node [shape=box, fontsize=10];\n'
+    if title:
+        header += f'  labelloc="t";\n  label="{title}";\n'
 
-    for parent, deps in graph.items():
-        pid = _node_id(parent)
-        for child in deps:
-            cid = _node_id(child)
-            lines.append(f"  {pid} -> {cid};")
+    # The graph is resolved before the file is opened. Output is streamed in
+    # joined blocks: the header, all nodes, then each parent's edges, so no
+    # full copy of the document is ever held in memory.
+    with open(path, "w", encoding="utf-8") as f:
+        write = f.write
+        write(header)
+        write("".join([f'  {nid} [label="{_node_label(k)}"];\n' for k, nid in ids.items()]))
 
-    lines.append("}")
+        for parent, deps in graph.items():
+            if deps:
+                pid = _node_id(parent)
+                write("".join([f"  {pid} -> {_node_id(child)};\n" for child in deps]))
 
-    with open(path, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines))
+        write("}")
@@ -5,13 +5,24 @@ querying registered providers by qualifier, primary flag, infra type,
 and other indexed attributes.
 """
 
-from typing import Any, Dict, Iterable, List, Optional, Set, Union
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 from .factory import ProviderMetadata
 
 KeyT = Union[str, type]
 
 
+def _is_subclass(typ: type, base: Any) -> bool:
+    # For plain classes (metaclass ``type``) issubclass is exactly MRO
+    # membership; only ABCs, protocols and custom metaclasses need the
+    # __subclasscheck__ machinery.
+    if base in typ.__mro__:
+        return True
+    if type(base) is type:
+        return False
+    return issubclass(typ, base)
+
+
 class ComponentLocator:
     """Read-only, queryable index of all registered component metadata.
 
@@ -28,6 +39,9 @@ class ComponentLocator:
         self._metadata = metadata
         self._indexes = indexes
         self._candidates: Optional[Set[KeyT]] = None
+        self._by_supertype: Optional[Dict[type, Tuple[KeyT, ...]]] = None
+        self._by_pico_name: Optional[Dict[Any, KeyT]] = None
+        self._protocol_matches: Dict[Tuple[type, type], bool] = {}
 
     def _ensure(self) -> Set[KeyT]:
         return set(self._metadata.keys()) if self._candidates is None else set(self._candidates)
@@ -42,6 +56,9 @@ class ComponentLocator:
     def _new(self, candidates: Set[KeyT]) -> "ComponentLocator":
         nl = ComponentLocator(self._metadata, self._indexes)
         nl._candidates = candidates
+        nl._by_supertype = self._by_supertype
+        nl._by_pico_name = self._by_pico_name
+        nl._protocol_matches = self._protocol_matches
         return nl
 
     def with_index_any(self, name: str, *values: Any) -> "ComponentLocator":
@@ -103,32 +120,102 @@ class ComponentLocator:
                 return False
         return True
 
-    def collect_by_type(self, t: type, q: Optional[str]) -> List[KeyT]:
-        keys = list(self._metadata.keys())
-        out: List[KeyT] = []
-        for k in keys:
-            md = self._metadata.get(k)
-            if md is None:
+    def _supertype_index(self) -> Dict[type, Tuple[KeyT, ...]]:
+        idx = self._by_supertype
+        if idx is not None:
+            return idx
+        # Most bases have a single provider: keep that as a 1-tuple (which is
+        # already the final shape) and only promote to a list on a second key.
+        buckets: Dict[type, Union[Tuple[KeyT, ...], List[KeyT]]] = {}
+        for k, md in self._metadata.items():
+            typ = md.effective_type if md is not None else None
+            if not isinstance(typ, type):
                 continue
-            typ = md.provided_type or md.concrete_class
+            for base in typ.__mro__:
+                bucket = buckets.get(base)
+                if bucket is None:
+                    buckets[base] = (k,)
+                elif type(bucket) is tuple:
+                    buckets[base] = [*bucket, k]
+                else:
+                    bucket.append(k)
+        idx = self._by_supertype = {
+            base: keys if type(keys) is tuple else tuple(keys) for base, keys in buckets.items()
+        }
+        return idx
+
+    def subtype_keys(self, t: type) -> Tuple[KeyT, ...]:
+        """Keys whose provided type is *t* or a subclass of it, in registration order.
+
+        Plain classes are answered from a reverse MRO index built on first use;
+        ABCs, protocols and custom metaclasses fall back to a scan so virtual
+        subclasses are still honoured.
+        """
+        if type(t) is type:
+            return self._supertype_index().get(t, ())
+        out: List[KeyT] = []
+        for k, md in self._metadata.items():
+            typ = md.effective_type if md is not None else None
             if not isinstance(typ, type):
                 continue
-
-            ok = False
             try:
-                ok = issubclass(typ, t)
+                if _is_subclass(typ, t):
+                    out.append(k)
             except Exception:
-                ok = ComponentLocator._implements_protocol(typ, t)
+                continue
+        return tuple(out)
+
+    def key_for_pico_name(self, name: Any) -> Optional[KeyT]:
+        idx = self._by_pico_name
+        if idx is None:
+            idx = {}
+            for k, md in self._metadata.items():
+                if md is not None and md.pico_name is not None:
+                    try:
+                        idx.setdefault(md.pico_name, k)
+                    except TypeError:
+                        continue
+            self._by_pico_name = idx
+        try:
+            return idx.get(name)
+        except TypeError:
+            return None
+
+    def collect_by_type(self, t: type, q: Optional[str]) -> List[KeyT]:
+        if type(t) is type:
+            keys = self._supertype_index().get(t, ())
+            if q is None:
+                return list(keys)
+            return [k for k in keys if q in self._metadata[k].qualifiers]
 
-            if ok and (q is None or q in md.qualifiers):
+        out: List[KeyT] = []
+        for k, md in self._metadata.items():
+            if md is None or (q is not None and q not in md.qualifiers):
+                continue
+            typ = md.effective_type
+            if isinstance(typ, type) and self._is_compatible(typ, t):
                 out.append(k)
         return out
 
+    def _is_compatible(self, typ: type, base: type) -> bool:
+        # Non-runtime protocols reject issubclass, so they fall back to a
+        # structural probe; remember its verdict per (type, protocol) pair
+        # instead of re-raising and re-probing on every collection.
+        key = (typ, base)
+        hit = self._protocol_matches.get(key)
+        if hit is not None:
+            return hit
+        try:
+            return _is_subclass(typ, base)
+        except Exception:
+            hit = self._protocol_matches[key] = ComponentLocator._implements_protocol(typ, base)
+            return hit
+
     def find_key_by_name(self, name: str) -> Optional[KeyT]:
         for k, md in self._metadata.items():
             if md.pico_name == name:
                 return k
-            typ = md.provided_type or md.concrete_class
+            typ = md.effective_type
             if isinstance(typ, type) and getattr(typ, "__name__", "") == name:
                 return k
         return None
@@ -136,14 +223,9 @@ class ComponentLocator:
     def dependency_keys_for_static(self, md: ProviderMetadata):
         deps: List[KeyT] = []
         for dep in md.dependencies:
-            if dep.is_list:
-                if isinstance(dep.key, type):
-                    keys = self.collect_by_type(dep.key, dep.qualifier)
-                    deps.extend(keys)
-            elif dep.is_dict:
+            if dep.is_list or dep.is_dict:
                 if isinstance(dep.key, type):
-                    keys = self.collect_by_type(dep.key, dep.qualifier)
-                    deps.extend(keys)
+                    deps.extend(self.collect_by_type(dep.key, dep.qualifier))
             else:
                 deps.append(dep.key)
         return tuple(deps)
@@ -30,8 +30,8 @@ class ProviderSelector:
         winners: Dict[KeyT, Tuple[Provider, ProviderMetadata]] = {}
 
         for key, lst in candidates.items():
-            lst_sorted = sorted(lst, key=self._rank_provider, reverse=True)
-            chosen = lst_sorted[0]
+            # A lone candidate wins without ranking (ranking may probe config sources).
+            chosen = lst[0] if len(lst) == 1 else max(lst, key=self._rank_provider)
             winners[key] = (chosen[1], chosen[2])
 
         return winners
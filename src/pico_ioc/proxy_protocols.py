@@ -1,161 +1,26 @@
+import operator
+
 from .exceptions import SerializationError
 
 
 class _ProxyProtocolMixin:
+    # Subclasses may keep the real object in a ``_target`` slot once it is
+    # known; the forwarding dunders read it directly and only call
+    # ``_get_real_object`` (which may create the target) while it is unset.
     __slots__ = ()
-
-    def __str__(self):
-        return str(self._get_real_object())
-
-    def __repr__(self):
-        return repr(self._get_real_object())
-
-    def __dir__(self):
-        return dir(self._get_real_object())
-
-    def __len__(self):
-        return len(self._get_real_object())
-
-    def __getitem__(self, key):
-        return self._get_real_object()[key]
+    _target = None
 
     def __setitem__(self, key, value):
         self._get_real_object()[key] = value
 
-    def __delitem__(self, key):
-        del self._get_real_object()[key]
-
-    def __iter__(self):
-        return iter(self._get_real_object())
-
-    def __reversed__(self):
-        return reversed(self._get_real_object())
-
-    def __contains__(self, item):
-        return item in self._get_real_object()
-
-    def __add__(self, other):
-        return self._get_real_object() + other
-
-    def __sub__(self, other):
-        return self._get_real_object() - other
-
-    def __mul__(self, other):
-        return self._get_real_object() * other
-
-    def __matmul__(self, other):
-        return self._get_real_object() @ other
-
-    def __truediv__(self, other):
-        return self._get_real_object() / other
-
-    def __floordiv__(self, other):
-        return self._get_real_object() // other
-
-    def __mod__(self, other):
-        return self._get_real_object() % other
-
-    def __divmod__(self, other):
-        return divmod(self._get_real_object(), other)
-
     def __pow__(self, other, modulo=None):
         return pow(self._get_real_object(), other, modulo)
 
-    def __lshift__(self, other):
-        return self._get_real_object() << other
-
-    def __rshift__(self, other):
-        return self._get_real_object() >> other
-
-    def __and__(self, other):
-        return self._get_real_object() & other
-
-    def __xor__(self, other):
-        return self._get_real_object() ^ other
-
-    def __or__(self, other):
-        return self._get_real_object() | other
-
-    def __radd__(self, other):
-        return other + self._get_real_object()
-
-    def __rsub__(self, other):
-        return other - self._get_real_object()
-
-    def __rmul__(self, other):
-        return other * self._get_real_object()
-
-    def __rmatmul__(self, other):
-        return other @ self._get_real_object()
-
-    def __rtruediv__(self, other):
-        return other / self._get_real_object()
-
-    def __rfloordiv__(self, other):
-        return other // self._get_real_object()
-
-    def __rmod__(self, other):
-        return other % self._get_real_object()
-
-    def __rdivmod__(self, other):
-        return divmod(other, self._get_real_object())
-
-    def __rpow__(self, other):
-        return pow(other, self._get_real_object())
-
-    def __rlshift__(self, other):
-        return other << self._get_real_object()
-
-    def __rrshift__(self, other):
-        return other >> self._get_real_object()
-
-    def __rand__(self, other):
-        return other & self._get_real_object()
-
-    def __rxor__(self, other):
-        return other ^ self._get_real_object()
-
-    def __ror__(self, other):
-        return other | self._get_real_object()
-
-    def __neg__(self):
-        return -self._get_real_object()
-
-    def __pos__(self):
-        return +self._get_real_object()
-
-    def __abs__(self):
-        return abs(self._get_real_object())
-
-    def __invert__(self):
-        return ~self._get_real_object()
-
-    def __eq__(self, other):
-        return self._get_real_object() == other
-
-    def __ne__(self, other):
-        return self._get_real_object() != other
-
-    def __lt__(self, other):
-        return self._get_real_object() < other
-
-    def __le__(self, other):
-        return self._get_real_object() <= other
-
-    def __gt__(self, other):
-        return self._get_real_object() > other
-
-    def __ge__(self, other):
-        return self._get_real_object() >= other
-
-    def __hash__(self):
-        return hash(self._get_real_object())
-
-    def __bool__(self):
-        return bool(self._get_real_object())
-
     def __call__(self, *args, **kwargs):
-        return self._get_real_object()(*args, **kwargs)
+        o = self._target
+        if o is None:
+            o = self._get_real_object()
+        return o(*args, **kwargs)
 
     def __enter__(self):
         return self._get_real_object().__enter__()
@@ -169,3 +34,108 @@ class _ProxyProtocolMixin:
             return o.__reduce_ex__(protocol)
         except Exception as e:
             raise SerializationError(f"Proxy target is not serializable: {e}")
+
+
+# The remaining protocol methods differ only in the operation they forward,
+# so they are built from tables: ``op(target)``, ``op(target, other)`` and the
+# reflected ``op(other, target)``.
+
+_UNARY = {
+    "__str__": str,
+    "__repr__": repr,
+    "__dir__": dir,
+    "__len__": len,
+    "__iter__": iter,
+    "__reversed__": reversed,
+    "__neg__": operator.neg,
+    "__pos__": operator.pos,
+    "__abs__": abs,
+    "__invert__": operator.invert,
+    "__hash__": hash,
+    "__bool__": bool,
+}
+
+_BINARY = {
+    "__getitem__": operator.getitem,
+    "__delitem__": operator.delitem,
+    "__contains__": operator.contains,
+    "__add__": operator.add,
+    "__sub__": operator.sub,
+    "__mul__": operator.mul,
+    "__matmul__": operator.matmul,
+    "__truediv__": operator.truediv,
+    "__floordiv__": operator.floordiv,
+    "__mod__": operator.mod,
+    "__divmod__": divmod,
+    "__lshift__": operator.lshift,
+    "__rshift__": operator.rshift,
+    "__and__": operator.and_,
+    "__xor__": operator.xor,
+    "__or__": operator.or_,
+    "__eq__": operator.eq,
+    "__ne__": operator.ne,
+    "__lt__": operator.lt,
+    "__le__": operator.le,
+    "__gt__": operator.gt,
+    "__ge__": operator.ge,
+}
+
+_REFLECTED = {
+    "__radd__": operator.add,
+    "__rsub__": operator.sub,
+    "__rmul__": operator.mul,
+    "__rmatmul__": operator.matmul,
+    "__rtruediv__": operator.truediv,
+    "__rfloordiv__": operator.floordiv,
+    "__rmod__": operator.mod,
+    "__rdivmod__": divmod,
+    "__rpow__": pow,
+    "__rlshift__": operator.lshift,
+    "__rrshift__": operator.rshift,
+    "__rand__": operator.and_,
+    "__rxor__": operator.xor,
+    "__ror__": operator.or_,
+}
+
+
+def _unary(op):
+    def method(self):
+        o = self._target
+        if o is None:
+            o = self._get_real_object()
+        return op(o)
+
+    return method
+
+
+def _binary(op):
+    def method(self, other):
+        o = self._target
+        if o is None:
+            o = self._get_real_object()
+        return op(o, other)
+
+    return method
+
+
+def _reflected(op):
+    def method(self, other):
+        o = self._target
+        if o is None:
+            o = self._get_real_object()
+        return op(other, o)
+
+    return method
+
+
+def _install(table, make):
+    for name, op in table.items():
+        method = make(op)
+        method.__name__ = name
+        method.__qualname__ = f"{_ProxyProtocolMixin.__qualname__}.{name}"
+        setattr(_ProxyProtocolMixin, name, method)
+
+
+_install(_UNARY, _unary)
+_install(_BINARY, _binary)
+_install(_REFLECTED, _reflected)
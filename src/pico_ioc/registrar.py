@@ -1,5 +1,7 @@
+import functools
 import logging
 import os
+from operator import itemgetter
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from .analysis import DependencyRequest, analyze_callable_dependencies
@@ -12,7 +14,7 @@ from .constants import LOGGER, PICO_INFRA, PICO_META, PICO_NAME, SCOPE_SINGLETON
 from .container import PicoContainer
 from .dependency_validator import DependencyValidator
 from .factory import ComponentFactory, DeferredProvider, ProviderMetadata
-from .locator import ComponentLocator
+from .locator import ComponentLocator, _is_subclass
 from .provider_selector import ProviderSelector
 
 KeyT = Union[str, type]
@@ -23,10 +25,10 @@ def _can_be_selected_for(reg_md: Dict[KeyT, ProviderMetadata], selector: Any) ->
     if not isinstance(selector, type):
         return False
     for md in reg_md.values():
-        typ = md.provided_type or md.concrete_class
+        typ = md.effective_type
         if isinstance(typ, type):
             try:
-                if issubclass(typ, selector):
+                if _is_subclass(typ, selector):
                     return True
             except Exception:
                 continue
@@ -67,14 +69,14 @@ class Registrar:
         pico.attach_config_manager(self._config_manager)
         for deferred in self._deferred:
             deferred.attach(pico, locator)
-        for key, md in list(self._metadata.items()):
+        for key, md in self._metadata.items():
             if md.lazy:
                 original = self._factory.get(key, origin="lazy")
-
-                def lazy_proxy_provider(_orig=original, _p=pico, _k=key):
-                    return UnifiedComponentProxy(container=_p, object_creator=_orig, component_key=_k)
-
-                self._factory.bind(key, lazy_proxy_provider)
+                # partial is called from C: no extra Python frame per lazy resolve.
+                lazy_provider = functools.partial(
+                    UnifiedComponentProxy, container=pico, object_creator=original, component_key=key
+                )
+                self._factory.bind(key, lazy_provider)
 
     def _bind_if_absent(self, key: KeyT, provider: Provider) -> None:
         if not self._factory.has(key):
@@ -84,20 +86,21 @@ class Registrar:
         self._scanner.scan_module(module)
 
     def _find_md_for_type(self, t: type) -> Optional[ProviderMetadata]:
-        cands: List[ProviderMetadata] = []
+        first: Optional[ProviderMetadata] = None
         for md in self._metadata.values():
-            typ = md.provided_type or md.concrete_class
+            typ = md.effective_type
             if not isinstance(typ, type):
                 continue
             try:
-                if issubclass(typ, t):
-                    cands.append(md)
+                if not _is_subclass(typ, t):
+                    continue
             except Exception:
                 continue
-        if not cands:
-            return None
-        prim = [m for m in cands if m.primary]
-        return prim[0] if prim else cands[0]
+            if md.primary:
+                return md
+            if first is None:
+                first = md
+        return first
 
     def _find_narrower_scope_from_deps(self, deps: Tuple[DependencyRequest, ...]) -> Optional[str]:
         if not deps:
@@ -117,6 +120,11 @@ class Registrar:
         return None
 
     def _promote_scopes(self) -> None:
+        # Promotion only ever copies a narrower scope from a dependency: with
+        # no non-singleton provider there is nothing to find, so skip the
+        # per-dependency type scans entirely.
+        if all(md.scope == SCOPE_SINGLETON for md in self._metadata.values()):
+            return
         for k, md in list(self._metadata.items()):
             if md.scope == SCOPE_SINGLETON:
                 ns = self._find_narrower_scope_from_deps(md.dependencies)
@@ -139,10 +147,19 @@ class Registrar:
 
     def _rebuild_indexes(self) -> None:
         self._indexes.clear()
+        indexes = self._indexes
 
+        # Each metadata key is visited once (and qualifiers are a set), so a
+        # bucket never sees the same key twice: append without a membership
+        # scan, and only allocate containers on a miss.
         def add(idx: str, val: Any, key: KeyT):
-            b = self._indexes.setdefault(idx, {}).setdefault(val, [])
-            if key not in b:
+            by_val = indexes.get(idx)
+            if by_val is None:
+                by_val = indexes[idx] = {}
+            b = by_val.get(val)
+            if b is None:
+                by_val[val] = [key]
+            else:
                 b.append(key)
 
         for k, md in self._metadata.items():
@@ -162,9 +179,9 @@ class Registrar:
         self._provides_functions = provides_functions
 
         winners = self._provider_selector.select_providers(candidates)
-        for key, (provider, md) in winners.items():
-            self._bind_if_absent(key, provider)
-            self._metadata[key] = md
+        has = self._factory.has
+        self._factory.bind_many({key: provider for key, (provider, _) in winners.items() if not has(key)})
+        self._metadata.update((key, md) for key, (_, md) in winners.items())
 
         if PicoContainer not in self._metadata:
             self._factory.bind(PicoContainer, lambda: pico_instance)
@@ -185,17 +202,18 @@ class Registrar:
             )
 
         self._promote_scopes()
-        self._rebuild_indexes()
 
-        for _, selector, default_cls in sorted(on_missing, key=lambda x: -x[0]):
+        # Highest priority first; the sort is stable, so equal priorities keep scan order.
+        for _, selector, default_cls in sorted(on_missing, key=itemgetter(0), reverse=True):
             key = selector
             if key in self._metadata or self._factory.has(key) or _can_be_selected_for(self._metadata, selector):
                 continue
 
             deps = analyze_callable_dependencies(default_cls.__init__)
             provider = DeferredProvider(lambda pico, loc, c=default_cls, d=deps: pico.build_class(c, loc, d))
-            qset = set(str(q) for q in getattr(default_cls, PICO_META, {}).get("qualifier", ()))
-            sc = getattr(default_cls, PICO_META, {}).get("scope", SCOPE_SINGLETON)
+            meta = getattr(default_cls, PICO_META, {})
+            qset = set(meta.get("qualifier", ()))
+            sc = meta.get("scope", SCOPE_SINGLETON)
             md = ProviderMetadata(
                 key=key,
                 provided_type=key if isinstance(key, type) else None,
@@ -204,7 +222,7 @@ class Registrar:
                 factory_method=None,
                 qualifiers=qset,
                 primary=True,
-                lazy=bool(getattr(default_cls, PICO_META, {}).get("lazy", False)),
+                lazy=bool(meta.get("lazy", False)),
                 infra=getattr(default_cls, PICO_INFRA, None),
                 pico_name=getattr(default_cls, PICO_NAME, None),
                 override=True,
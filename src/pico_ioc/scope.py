@@ -7,15 +7,27 @@ transaction, or custom scopes).
 """
 
 import contextvars
-import inspect
 import logging
-from typing import Any, Dict, Optional, Tuple
+import threading
+from itertools import islice
+from typing import Any, Callable, Dict, Optional, Tuple
 
 from .constants import SCOPE_PROTOTYPE, SCOPE_SINGLETON
+from .decorators import _marked_method_names
 from .exceptions import ScopeError
 
 _logger = logging.getLogger(__name__)
 
+_RESERVED_SCOPES = frozenset({SCOPE_SINGLETON, SCOPE_PROTOTYPE})
+
+# Built-in context scopes and the names of their backing ContextVars.
+_BUILTIN_SCOPE_VARS = {
+    "request": "pico_request_id",
+    "session": "pico_session_id",
+    "websocket": "pico_websocket_id",
+    "transaction": "pico_tx_id",
+}
+
 
 class ScopeProtocol:
     """Protocol for scope implementations.
@@ -24,6 +36,8 @@ class ScopeProtocol:
     current scope identifier (or ``None`` if the scope is not active).
     """
 
+    __slots__ = ()
+
     def get_id(self) -> Any | None: ...
 
 
@@ -38,6 +52,8 @@ class ContextVarScope(ScopeProtocol):
         var: The context variable that stores the scope identifier.
     """
 
+    __slots__ = ("_var",)
+
     def __init__(self, var: contextvars.ContextVar) -> None:
         self._var = var
 
@@ -52,6 +68,8 @@ class ContextVarScope(ScopeProtocol):
 
 
 class ComponentContainer:
+    __slots__ = ("_instances",)
+
     def __init__(self) -> None:
         self._instances: Dict[object, object] = {}
 
@@ -66,6 +84,8 @@ class ComponentContainer:
 
 
 class _NoCacheContainer(ComponentContainer):
+    __slots__ = ()
+
     def __init__(self) -> None:
         pass
 
@@ -79,6 +99,14 @@ class _NoCacheContainer(ComponentContainer):
         return []
 
 
+def _no_id() -> None:
+    return None
+
+
+# Stateless, so every ScopedCaches shares one instance for prototype scope.
+_NO_CACHE = _NoCacheContainer()
+
+
 class ScopeManager:
     """Registry and coordinator for all scope implementations.
 
@@ -87,13 +115,28 @@ class ScopeManager:
     :meth:`register_scope`.
     """
 
+    __slots__ = ("_scopes", "_names", "_id_getters", "_lock")
+
     def __init__(self) -> None:
-        self._scopes: Dict[str, ScopeProtocol] = {
-            "request": ContextVarScope(contextvars.ContextVar("pico_request_id", default=None)),
-            "session": ContextVarScope(contextvars.ContextVar("pico_session_id", default=None)),
-            "websocket": ContextVarScope(contextvars.ContextVar("pico_websocket_id", default=None)),
-            "transaction": ContextVarScope(contextvars.ContextVar("pico_tx_id", default=None)),
-        }
+        # Built-in scopes get their ContextVar on first activation (see
+        # _builtin_scope); until then they simply have no active ID.
+        self._scopes: Dict[str, ScopeProtocol] = {}
+        self._names: Optional[Tuple[str, ...]] = None
+        self._id_getters: Optional[Tuple[Callable[[], Any], ...]] = None
+        # Serializes adding scope implementations with rebuilding the derived
+        # caches, so a rebuild can never store a view that misses a new scope.
+        self._lock = threading.RLock()
+
+    def _builtin_scope(self, name: str) -> Optional[ScopeProtocol]:
+        var_name = _BUILTIN_SCOPE_VARS.get(name)
+        if var_name is None:
+            return None
+        created = ContextVarScope(contextvars.ContextVar(var_name, default=None))
+        with self._lock:
+            # Concurrent first activations must share one ContextVar.
+            impl = self._scopes.setdefault(name, created)
+            self._id_getters = None
+        return impl
 
     def register_scope(self, name: str) -> None:
         """Register a custom scope backed by a new ``ContextVar``.
@@ -107,53 +150,83 @@ class ScopeManager:
         """
         if not isinstance(name, str) or not name:
             raise ScopeError("Scope name must be a non-empty string")
-        if name in (SCOPE_SINGLETON, SCOPE_PROTOTYPE):
+        if name in _RESERVED_SCOPES:
             raise ScopeError(f"Cannot register reserved scope: '{name}'")
-        if name in self._scopes:
+        if name in self._scopes or name in _BUILTIN_SCOPE_VARS:
             return
 
         var_name = f"pico_{name}_id"
         context_var = contextvars.ContextVar(var_name, default=None)
         implementation = ContextVarScope(context_var)
-        self._scopes[name] = implementation
+        with self._lock:
+            if self._scopes.setdefault(name, implementation) is implementation:
+                self._names = None
+                self._id_getters = None
+
+    # Reserved names can never be registered, so a single dict lookup answers
+    # both "is this a context scope" and "which implementation"; the reserved
+    # and built-in checks only run on a miss.
 
     def get_id(self, name: str) -> Any | None:
-        if name in (SCOPE_SINGLETON, SCOPE_PROTOTYPE):
-            return None
         impl = self._scopes.get(name)
-        return impl.get_id() if impl else None
+        return impl.get_id() if impl is not None else None
 
     def activate(self, name: str, scope_id: Any) -> Optional[contextvars.Token]:
-        if name in (SCOPE_SINGLETON, SCOPE_PROTOTYPE):
-            return None
         impl = self._scopes.get(name)
         if impl is None:
-            from .exceptions import ScopeError
-
-            raise ScopeError(f"Unknown scope: {name}")
+            if name in _RESERVED_SCOPES:
+                return None
+            impl = self._builtin_scope(name)
+            if impl is None:
+                raise ScopeError(f"Unknown scope: {name}")
         if hasattr(impl, "activate"):
             return getattr(impl, "activate")(scope_id)
         return None
 
     def deactivate(self, name: str, token: Optional[contextvars.Token]) -> None:
-        if name in (SCOPE_SINGLETON, SCOPE_PROTOTYPE):
-            return
         impl = self._scopes.get(name)
         if impl is None:
-            from .exceptions import ScopeError
-
-            raise ScopeError(f"Unknown scope: {name}")
+            if name in _RESERVED_SCOPES:
+                return
+            impl = self._builtin_scope(name)
+            if impl is None:
+                raise ScopeError(f"Unknown scope: {name}")
         if token is not None and hasattr(impl, "deactivate"):
             getattr(impl, "deactivate")(token)
 
     def names(self) -> Tuple[str, ...]:
-        return tuple(n for n in self._scopes.keys() if n not in (SCOPE_SINGLETON, SCOPE_PROTOTYPE))
+        names = self._names
+        if names is None:
+            with self._lock:
+                names = self._names = tuple(dict.fromkeys((*_BUILTIN_SCOPE_VARS, *self._scopes)))
+        return names
 
     def signature(self, names: Tuple[str, ...]) -> Tuple[Any, ...]:
         return tuple(self.get_id(n) for n in names)
 
+    # One zero-argument callable per name in ``names()`` order: the ContextVar's
+    # own ``get`` for ContextVar-backed scopes, so building the signature needs
+    # no name lookups. Rebuilt whenever a scope implementation is added.
+
+    def _build_id_getters(self) -> Tuple[Callable[[], Any], ...]:
+        with self._lock:
+            getters = []
+            for name in self.names():
+                impl = self._scopes.get(name)
+                if impl is None:
+                    getters.append(_no_id)
+                elif type(impl) is ContextVarScope:
+                    getters.append(impl._var.get)
+                else:
+                    getters.append(impl.get_id)
+            id_getters = self._id_getters = tuple(getters)
+        return id_getters
+
     def signature_all(self) -> Tuple[Any, ...]:
-        return self.signature(self.names())
+        getters = self._id_getters
+        if getters is None:
+            getters = self._build_id_getters()
+        return tuple([get() for get in getters])
 
 
 class ScopedCaches:
@@ -166,28 +239,25 @@ class ScopedCaches:
     def __init__(self) -> None:
         self._singleton = ComponentContainer()
         self._by_scope: Dict[str, Dict[Any, ComponentContainer]] = {}
-        self._no_cache = _NoCacheContainer()
+        self._no_cache = _NO_CACHE
 
     def _cleanup_object(self, obj: Any) -> None:
         try:
-            from .constants import PICO_META
-        except Exception:
-            PICO_META = "_pico_meta"
-        try:
-            for _, m in inspect.getmembers(obj, predicate=inspect.ismethod):
-                meta = getattr(m, PICO_META, {})
-                if meta.get("cleanup", False):
-                    try:
-                        m()
-                    except Exception as e:
-                        _logger.warning(
-                            "Cleanup method %s.%s failed: %s",
-                            type(obj).__name__,
-                            getattr(m, "__name__", "<unknown>"),
-                            e,
-                        )
+            names = _marked_method_names(obj.__class__, "cleanup")
         except Exception as e:
             _logger.debug("Failed to inspect object for cleanup: %s", e)
+            return
+        for name in names:
+            try:
+                m = getattr(obj, name)
+                m()
+            except Exception as e:
+                _logger.warning(
+                    "Cleanup method %s.%s failed: %s",
+                    type(obj).__name__,
+                    name,
+                    e,
+                )
 
     def cleanup_scope(self, scope_name: str, scope_id: Any) -> None:
         bucket = self._by_scope.get(scope_name)
@@ -206,7 +276,7 @@ class ScopedCaches:
         if scope == SCOPE_SINGLETON:
             return self._singleton
         if scope == SCOPE_PROTOTYPE:
-            return self._no_cache
+            return _NO_CACHE
 
         sid = scopes.get_id(scope)
 
@@ -216,12 +286,15 @@ class ScopedCaches:
                 f"Are you trying to use a {scope}-scoped component outside of its context?"
             )
 
-        bucket = self._by_scope.setdefault(scope, {})
-        if sid in bucket:
-            return bucket[sid]
-
-        c = ComponentContainer()
-        bucket[sid] = c
+        bucket = self._by_scope.get(scope)
+        if bucket is None:
+            bucket = self._by_scope[scope] = {}
+        else:
+            c = bucket.get(sid)
+            if c is not None:
+                return c
+
+        c = bucket[sid] = ComponentContainer()
         return c
 
     def all_items(self):
@@ -233,7 +306,7 @@ class ScopedCaches:
                     yield item
 
     def shrink(self, scope: str, keep: int) -> None:
-        if scope in (SCOPE_SINGLETON, SCOPE_PROTOTYPE):
+        if scope in _RESERVED_SCOPES:
             return
         bucket = self._by_scope.get(scope)
         if not bucket:
@@ -241,8 +314,9 @@ class ScopedCaches:
 
         # Manual cleanup if needed, though we rely on explicit cleanup now
         if len(bucket) > keep:
-            # Simple eviction strategy if forced manually
-            keys_to_remove = list(bucket.keys())[: len(bucket) - keep]
+            # Simple eviction strategy if forced manually: the oldest entries
+            # come first, so only the prefix being evicted is materialised.
+            keys_to_remove = list(islice(bucket, len(bucket) - keep))
             for k in keys_to_remove:
                 container = bucket.pop(k)
                 self._cleanup_container(container)
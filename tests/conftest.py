@@ -2,6 +2,8 @@ import logging
 
 import pytest
 
+from pico_ioc.factory import ProviderMetadata
+
 log_capture: list[str] = []
 
 
@@ -13,3 +15,26 @@ class ListLogHandler(logging.Handler):
 @pytest.fixture(autouse=True)
 def reset_logging_capture():
     log_capture.clear()
+
+
+@pytest.fixture
+def make_metadata():
+    """Build a ``ProviderMetadata`` with neutral defaults; keyword arguments override any field."""
+
+    def build(key, **overrides):
+        fields = dict(
+            key=key,
+            provided_type=None,
+            concrete_class=None,
+            factory_class=None,
+            factory_method=None,
+            qualifiers=set(),
+            primary=False,
+            lazy=False,
+            infra="component",
+            pico_name=None,
+        )
+        fields.update(overrides)
+        return ProviderMetadata(**fields)
+
+    return build
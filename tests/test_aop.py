@@ -1,4 +1,3 @@
-import inspect
 from typing import Any, Callable, List
 
 import pytest
@@ -28,29 +27,22 @@ class LoggingInterceptor(MethodInterceptor):
 
         ctx.kwargs["name"] = ctx.kwargs.get("name", "").upper()
 
-        original_func = ctx.method
-        if hasattr(original_func, "__func__"):
-            original_func = original_func.__func__
+        if ctx.is_async:
+            return _after_async(call_next(ctx), ctx, self.logger)
 
-        is_async = inspect.iscoroutinefunction(original_func)
+        result = call_next(ctx)
 
-        if is_async:
+        modified_result = f"{result} - Intercepted!"
+        self.logger.log(f"Exiting method: {ctx.name}")
+        return modified_result
 
-            async def async_wrapper():
-                result_coro = call_next(ctx)
-                result = await result_coro
 
-                modified_result = f"{result} - Intercepted!"
-                self.logger.log(f"Exiting method: {ctx.name}")
-                return modified_result
+async def _after_async(result_coro, ctx: MethodCtx, logger: CallLogger) -> str:
+    result = await result_coro
 
-            return async_wrapper()
-        else:
-            result = call_next(ctx)
-
-            modified_result = f"{result} - Intercepted!"
-            self.logger.log(f"Exiting method: {ctx.name}")
-            return modified_result
+    modified_result = f"{result} - Intercepted!"
+    logger.log(f"Exiting method: {ctx.name}")
+    return modified_result
 
 
 @component
@@ -70,13 +62,18 @@ class UnrelatedService:
         return f"Hello {name}"
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def container():
     c = init(modules=[__name__], overrides={CallLogger: CallLogger()})
     yield c
     c.shutdown()
 
 
+@pytest.fixture(autouse=True)
+def reset_logger(container):
+    container.get(CallLogger).clear()
+
+
 def test_aop_intercepts_sync_call(container):
     service = container.get(MyService)
     logger = container.get(CallLogger)
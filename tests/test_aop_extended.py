@@ -12,7 +12,9 @@ from pico_ioc.aop import (
     MethodCtx,
     MethodInterceptor,
     UnifiedComponentProxy,
+    _compile_chain,
     _gather_interceptors_for_method,
+    _proxy_class_for,
     dispatch_method,
     health,
     intercepted_by,
@@ -20,6 +22,18 @@ from pico_ioc.aop import (
 from pico_ioc.exceptions import AsyncResolutionError, SerializationError
 
 
+class _FakeContainer:
+    """Minimal stand-in for the owning container of a proxy."""
+
+    def _run_configure_methods(self, obj):
+        return None
+
+
+@pytest.fixture
+def container():
+    return _FakeContainer()
+
+
 class TestMethodCtx:
     """Test MethodCtx data class."""
 
@@ -65,6 +79,17 @@ class TestMethodCtx:
         assert ctx.local["key1"] == "value1"
         assert ctx.local["key2"] == 42
 
+    def test_method_ctx_positional_and_lazy_local(self):
+        """MethodCtx accepts positional arguments and allocates local on first use."""
+        ctx = MethodCtx(None, object, len, "len", ("ab",), {}, None)
+
+        assert ctx.request_key is None
+        assert ctx.is_async is False
+        assert ctx._local is None
+        assert ctx.local is ctx.local
+        ctx.local = {"shared": True}
+        assert ctx.local == {"shared": True}
+
 
 class TestDispatchMethod:
     """Test dispatch_method function."""
@@ -146,6 +171,30 @@ class TestDispatchMethod:
 
         assert result == 10
 
+    def test_compiled_chain_is_reusable_and_call_next_can_retry(self):
+        """A compiled chain serves many calls; calling call_next again re-runs the rest of it."""
+        seen = []
+
+        class RetryInterceptor:
+            def invoke(self, ctx, call_next):
+                call_next(ctx)
+                return call_next(ctx)
+
+        class CountingInterceptor:
+            def invoke(self, ctx, call_next):
+                seen.append(ctx.args)
+                return call_next(ctx)
+
+        def method(x):
+            return x + 1
+
+        chain = _compile_chain([RetryInterceptor(), CountingInterceptor()])
+        for x in (1, 2):
+            ctx = MethodCtx(instance=None, cls=object, method=method, name="inc", args=(x,), kwargs={}, container=None)
+            assert chain(ctx) == x + 1
+
+        assert seen == [(1,), (1,), (2,), (2,)]
+
 
 class TestInterceptedBy:
     """Test @intercepted_by decorator."""
@@ -200,6 +249,39 @@ class TestInterceptedBy:
         assert InterceptorA in my_method._pico_interceptors_
         assert InterceptorB in my_method._pico_interceptors_
 
+    def test_intercepted_by_deduplicates_in_first_seen_order(self):
+        """Repeated interceptor classes appear once, in first-applied order."""
+
+        class InterceptorA:
+            pass
+
+        class InterceptorB:
+            pass
+
+        @intercepted_by(InterceptorA, InterceptorB, InterceptorA)
+        @intercepted_by(InterceptorB)
+        def my_method():
+            pass
+
+        assert my_method._pico_interceptors_ == (InterceptorB, InterceptorA)
+
+    def test_intercepted_by_classifies_async_once(self):
+        """@intercepted_by records whether the method is a coroutine function."""
+
+        class Interceptor:
+            pass
+
+        @intercepted_by(Interceptor)
+        def sync_method():
+            pass
+
+        @intercepted_by(Interceptor)
+        async def async_method():
+            pass
+
+        assert sync_method._pico_is_async_ is False
+        assert async_method._pico_is_async_ is True
+
     def test_intercepted_by_no_args_raises(self):
         """@intercepted_by with no args raises TypeError."""
         with pytest.raises(TypeError):
@@ -265,6 +347,99 @@ class TestGatherInterceptors:
 
         assert result == ()
 
+    def test_gather_interceptors_memoized_per_class(self):
+        """The interceptor lookup for a class and name is computed once."""
+
+        class Interceptor:
+            pass
+
+        class MyClass:
+            @intercepted_by(Interceptor)
+            def run(self):
+                pass
+
+        assert _gather_interceptors_for_method(MyClass, "run") == (Interceptor,)
+        MyClass.run = lambda self: None
+        assert _gather_interceptors_for_method(MyClass, "run") == (Interceptor,)
+        assert _gather_interceptors_for_method(str, "append") == ()
+
+    def test_gather_interceptors_does_not_grow_for_unknown_names(self):
+        """Only intercepted methods are memoized; other names are answered without caching."""
+        from pico_ioc.aop import _interceptors_by_class
+
+        class Interceptor:
+            pass
+
+        class MyClass:
+            label = "x"
+
+            @intercepted_by(Interceptor)
+            def run(self):
+                pass
+
+            def plain(self):
+                pass
+
+        for i in range(50):
+            assert _gather_interceptors_for_method(MyClass, f"dynamic_{i}") == ()
+        assert _gather_interceptors_for_method(MyClass, "plain") == ()
+        assert _gather_interceptors_for_method(MyClass, "label") == ()
+        assert set(_interceptors_by_class[MyClass]) == {"run"}
+
+
+class TestGeneratedProxyClass:
+    """Test the per-class proxy subclasses built by _proxy_class_for."""
+
+    def test_proxy_class_built_once_with_accessors_for_intercepted_methods(self):
+        class Interceptor:
+            pass
+
+        class Base:
+            @intercepted_by(Interceptor)
+            def inherited(self):
+                return "inherited"
+
+        class Service(Base):
+            @intercepted_by(Interceptor)
+            def run(self):
+                return "run"
+
+            def plain(self):
+                return "plain"
+
+        proxy_cls = _proxy_class_for(Service)
+        assert _proxy_class_for(Service) is proxy_cls
+        assert issubclass(proxy_cls, UnifiedComponentProxy)
+        assert "run" in vars(proxy_cls)
+        assert "inherited" in vars(proxy_cls)
+        assert "plain" not in vars(proxy_cls)
+
+    def test_generated_accessor_runs_interceptor_chain(self):
+        calls = []
+
+        class Interceptor:
+            def invoke(self, ctx, call_next):
+                calls.append(ctx.name)
+                return call_next(ctx)
+
+        class Service:
+            @intercepted_by(Interceptor)
+            def run(self, x):
+                return x * 2
+
+            def plain(self):
+                return "plain"
+
+        container = MagicMock()
+        container.get.return_value = Interceptor()
+        container._locator = None
+        proxy = _proxy_class_for(Service)(container=container, target=Service())
+
+        assert proxy.run(21) == 42
+        assert proxy.plain() == "plain"
+        assert calls == ["run"]
+        assert type(proxy).__dictoffset__ == 0
+
 
 class TestHealthDecorator:
     """Test @health decorator."""
@@ -291,10 +466,9 @@ class TestHealthDecorator:
 class TestUnifiedComponentProxySerialization:
     """Test proxy serialization."""
 
-    def test_proxy_getstate_serializes_target(self):
+    def test_proxy_getstate_serializes_target(self, container):
         """__getstate__ serializes the target object."""
         target = {"key": "value", "number": 42}
-        container = MagicMock()
 
         proxy = UnifiedComponentProxy(container=container, target=target)
 
@@ -310,10 +484,9 @@ class TestUnifiedComponentProxySerialization:
         assert object.__getattribute__(new_proxy, "_container") is None
         assert object.__getattribute__(new_proxy, "_target") is None
 
-    def test_proxy_pickle_roundtrip(self):
+    def test_proxy_pickle_roundtrip(self, container):
         """Proxy survives pickle roundtrip - returns unpacked target."""
         target = [1, 2, 3]
-        container = MagicMock()
 
         proxy = UnifiedComponentProxy(container=container, target=target)
 
@@ -323,14 +496,13 @@ class TestUnifiedComponentProxySerialization:
         # Pickling a proxy returns the underlying target, not another proxy
         assert restored == target
 
-    def test_proxy_unpicklable_target_raises(self):
+    def test_proxy_unpicklable_target_raises(self, container):
         """Proxy with unpicklable target raises SerializationError."""
 
         class Unpicklable:
             def __getstate__(self):
                 raise TypeError("cannot serialize")
 
-        container = MagicMock()
         proxy = UnifiedComponentProxy(container=container, target=Unpicklable())
 
         with pytest.raises(SerializationError):
@@ -340,58 +512,74 @@ class TestUnifiedComponentProxySerialization:
 class TestUnifiedComponentProxyDunderMethods:
     """Test proxy dunder method delegation."""
 
-    def test_proxy_hash(self):
+    def test_proxy_container_dunders_create_lazy_target_once(self):
+        """Slot-backed dunders create the lazy target on first use, then reuse it."""
+        created = []
+
+        def creator():
+            created.append(1)
+            return [1, 2, 3]
+
+        proxy = UnifiedComponentProxy(container=MagicMock(spec=[]), object_creator=creator)
+
+        assert len(proxy) == 3
+        assert proxy[0] == 1
+        assert 2 in proxy
+        assert list(proxy) == [1, 2, 3]
+        assert created == [1]
+
+    def test_proxy_unset_own_slot_raises_attribute_error(self):
+        """An uninitialised proxy slot is not delegated to the target."""
+        proxy = object.__new__(UnifiedComponentProxy)
+
+        with pytest.raises(AttributeError):
+            proxy._target
+
+    def test_proxy_hash(self, container):
         """Proxy delegates __hash__ to target."""
         target = "hashable_string"
-        container = MagicMock()
 
         proxy = UnifiedComponentProxy(container=container, target=target)
 
         assert hash(proxy) == hash(target)
 
-    def test_proxy_bool_true(self):
+    def test_proxy_bool_true(self, container):
         """Proxy delegates __bool__ (truthy)."""
         target = [1, 2, 3]
-        container = MagicMock()
 
         proxy = UnifiedComponentProxy(container=container, target=target)
 
         assert bool(proxy) is True
 
-    def test_proxy_bool_false(self):
+    def test_proxy_bool_false(self, container):
         """Proxy delegates __bool__ (falsy)."""
         target = []
-        container = MagicMock()
 
         proxy = UnifiedComponentProxy(container=container, target=target)
 
         assert bool(proxy) is False
 
-    def test_proxy_call(self):
+    def test_proxy_call(self, container):
         """Proxy delegates __call__."""
 
         def target(x):
             return x * 2
 
-        container = MagicMock()
-
         proxy = UnifiedComponentProxy(container=container, target=target)
 
         assert proxy(5) == 10
 
-    def test_proxy_reversed(self):
+    def test_proxy_reversed(self, container):
         """Proxy delegates __reversed__."""
         target = [1, 2, 3]
-        container = MagicMock()
 
         proxy = UnifiedComponentProxy(container=container, target=target)
 
         assert list(reversed(proxy)) == [3, 2, 1]
 
-    def test_proxy_divmod(self):
+    def test_proxy_divmod(self, container):
         """Proxy delegates __divmod__."""
         target = 17
-        container = MagicMock()
 
         proxy = UnifiedComponentProxy(container=container, target=target)
 
@@ -401,7 +589,7 @@ class TestUnifiedComponentProxyDunderMethods:
 class TestUnifiedComponentProxyLazyInit:
     """Test lazy initialization of proxy."""
 
-    def test_lazy_proxy_defers_creation(self):
+    def test_lazy_proxy_defers_creation(self, container):
         """Proxy with creator defers object creation."""
         created = []
 
@@ -410,9 +598,6 @@ class TestUnifiedComponentProxyLazyInit:
             created.append(obj)
             return obj
 
-        container = MagicMock()
-        container._run_configure_methods = MagicMock(return_value=None)
-
         proxy = UnifiedComponentProxy(container=container, target=None, object_creator=creator)
 
         # Not created yet
@@ -423,7 +608,7 @@ class TestUnifiedComponentProxyLazyInit:
 
         assert len(created) == 1
 
-    def test_lazy_proxy_caches_result(self):
+    def test_lazy_proxy_caches_result(self, container):
         """Proxy caches created object."""
         creation_count = 0
 
@@ -432,9 +617,6 @@ class TestUnifiedComponentProxyLazyInit:
             creation_count += 1
             return {"id": creation_count}
 
-        container = MagicMock()
-        container._run_configure_methods = MagicMock(return_value=None)
-
         proxy = UnifiedComponentProxy(container=container, target=None, object_creator=creator)
 
         # Multiple accesses
@@ -445,22 +627,19 @@ class TestUnifiedComponentProxyLazyInit:
         assert creation_count == 1
         assert obj1 is obj2 is obj3
 
-    def test_lazy_proxy_creator_returns_none_raises(self):
+    def test_lazy_proxy_creator_returns_none_raises(self, container):
         """Proxy raises if creator returns None."""
 
         def bad_creator():
             return None
 
-        container = MagicMock()
-
         proxy = UnifiedComponentProxy(container=container, target=None, object_creator=bad_creator)
 
         with pytest.raises(RuntimeError, match="returned None"):
             proxy._get_real_object()
 
-    def test_lazy_proxy_non_callable_creator_raises(self):
+    def test_lazy_proxy_non_callable_creator_raises(self, container):
         """Proxy raises if creator is not callable."""
-        container = MagicMock()
 
         proxy = UnifiedComponentProxy(container=container, target=None, object_creator="not_callable")
 
@@ -476,9 +655,8 @@ class TestUnifiedComponentProxyValidation:
         with pytest.raises(ValueError, match="non-null container"):
             UnifiedComponentProxy(container=None, target={})
 
-    def test_proxy_requires_target_or_creator(self):
+    def test_proxy_requires_target_or_creator(self, container):
         """Proxy requires either target or object_creator."""
-        container = MagicMock()
 
         with pytest.raises(ValueError, match="target or an object_creator"):
             UnifiedComponentProxy(container=container, target=None, object_creator=None)
@@ -211,6 +211,24 @@ class TestCleanupLoggingFix:
         assert any("Cleanup method" in record.message for record in caplog.records)
         assert any("failed" in record.message.lower() for record in caplog.records)
 
+    def test_cleanup_object_does_not_evaluate_properties(self):
+        """Only @cleanup methods are touched; other attributes are never read."""
+        calls = []
+
+        class Service:
+            @property
+            def expensive(self):
+                calls.append("property")
+                raise RuntimeError("should not be evaluated")
+
+            @cleanup
+            def close(self):
+                calls.append("close")
+
+        ScopedCaches()._cleanup_object(Service())
+
+        assert calls == ["close"]
+
     def test_cleanup_container_processes_all_items(self):
         """Multiple objects in container should all be processed."""
         caches = ScopedCaches()
@@ -277,6 +295,12 @@ class TestScopedCachesEdgeCases:
         assert container.get("key") is None  # No caching
         assert container.items() == []
 
+    def test_prototype_no_cache_container_is_shared(self):
+        """The stateless prototype container is shared across ScopedCaches."""
+        scopes = ScopeManager()
+
+        assert ScopedCaches().for_scope(scopes, "prototype") is ScopedCaches().for_scope(scopes, "prototype")
+
     def test_all_items_iterates_all_caches(self):
         """all_items should yield from singleton and all scoped caches."""
         caches = ScopedCaches()
@@ -56,3 +56,27 @@ def test_stats_contains_container_id_and_profiles():
     assert isinstance(st["total_resolves"], int)
     assert isinstance(st["cache_hits"], int)
     assert "registered_components" in st
+
+
+def test_registry_does_not_keep_dropped_containers_alive():
+    import gc
+
+    c = init(_empty_module("m_weak"))
+    cid = c.container_id
+    assert cid in PicoContainer.all_containers()
+    del c
+    gc.collect()
+    assert cid not in PicoContainer.all_containers()
+
+
+def test_provider_runs_with_container_current_inside_and_outside_as_current():
+    c = init(_empty_module("m_provider_ctx"))
+    seen = []
+    c._factory.bind("probe", lambda: seen.append(PicoContainer.get_current()) or object())
+    c._factory.bind("probe2", lambda: seen.append(PicoContainer.get_current()) or object())
+    c.get("probe")
+    with c.as_current():
+        c.get("probe2")
+        assert PicoContainer.get_current() is c
+    assert seen == [c, c]
+    assert PicoContainer.get_current() is None
@@ -64,3 +64,29 @@ def test_health_check_exception():
 
     res = c.health_check()
     assert res["key.check"] is False
+
+
+def test_factory_bind_many_binds_and_replaces():
+    f = ComponentFactory()
+    f.bind("a", lambda: "old")
+    f.bind_many({"a": lambda: "new", "b": lambda: "b"})
+    assert f.get("a", origin=None)() == "new"
+    assert f.get("b", origin=None)() == "b"
+
+
+def test_overrides_win_over_scanned_providers():
+    import types
+
+    from pico_ioc import component, init
+
+    @component
+    class Scanned:
+        pass
+
+    mod = types.ModuleType("mod_overrides_batch")
+    mod.Scanned = Scanned
+    c = init(modules=[mod], overrides={Scanned: "stub"})
+    try:
+        assert c.get(Scanned) == "stub"
+    finally:
+        c.shutdown()
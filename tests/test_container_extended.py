@@ -20,7 +20,7 @@ from pico_ioc.container import (
     _needs_async_configure,
 )
 from pico_ioc.exceptions import AsyncResolutionError, ComponentCreationError, ConfigurationError, ProviderNotFoundError
-from pico_ioc.factory import ComponentFactory
+from pico_ioc.factory import ComponentFactory, ProviderMetadata
 from pico_ioc.scope import ScopedCaches, ScopeManager
 
 
@@ -214,6 +214,20 @@ class TestContainerInit:
         assert observer in container._observers
         container.shutdown()
 
+    def test_resolve_without_observers_skips_timing(self):
+        """No clock reads happen on resolve when no observers are registered."""
+        factory = ComponentFactory()
+        factory.bind("svc", lambda: object())
+        container = PicoContainer(factory, ScopedCaches(), ScopeManager())
+        try:
+            with patch("pico_ioc.container._perf_counter") as clock:
+                _, took_ms, was_cached, _, _, _ = container._resolve_or_create_internal("svc")
+            assert clock.call_count == 0
+            assert took_ms == 0.0
+            assert was_cached is False
+        finally:
+            container.shutdown()
+
 
 class TestContainerContext:
     """Test container context management."""
@@ -281,6 +295,31 @@ class TestContainerResolution:
         finally:
             container.shutdown()
 
+    def test_cache_for_memoizes_singleton_cache_per_key(self):
+        """_cache_for returns the same singleton cache for a registered key."""
+        container = init(modules=[__name__])
+        try:
+            cache = container._cache_for(RegisteredService)
+            assert container._cache_for(RegisteredService) is cache
+            instance = container.get(RegisteredService)
+            assert cache.get(RegisteredService) is instance
+            assert container.has("unknown_key") is False
+        finally:
+            container.shutdown()
+
+    def test_get_looks_up_the_cache_once_per_creation(self):
+        """A fresh resolve reuses the cache it probed for the final put."""
+        factory = ComponentFactory()
+        factory.bind("svc", lambda: object())
+        container = PicoContainer(factory, ScopedCaches(), ScopeManager())
+        try:
+            with patch.object(container, "_scope_and_cache", wraps=container._scope_and_cache) as spy:
+                instance = container.get("svc")
+            assert spy.call_count == 1
+            assert container.get("svc") is instance
+        finally:
+            container.shutdown()
+
 
 class TestContainerExportGraph:
     """Test dependency graph export functionality."""
@@ -403,6 +442,184 @@ class TestContainerCleanup:
 
         assert AsyncCleanableService.cleanup_called is True
 
+    def test_cleanup_skips_factories_without_cleanup_methods(self, make_metadata):
+        """Factory classes without @cleanup are not constructed at shutdown."""
+        from pico_ioc.locator import ComponentLocator
+
+        built = []
+
+        class PlainFactory:
+            def __init__(self):
+                built.append("plain")
+
+        class ClosingFactory:
+            def __init__(self):
+                built.append("closing")
+
+            @cleanup
+            def close(self):
+                built.append("closed")
+
+        def md(key, fc):
+            return make_metadata(
+                key, factory_class=fc, factory_method="build", primary=True, infra="provides", pico_name=key
+            )
+
+        container = PicoContainer(ComponentFactory(), ScopedCaches(), ScopeManager())
+        container.attach_locator(ComponentLocator({"a": md("a", PlainFactory), "b": md("b", ClosingFactory)}, {}))
+        container.cleanup_all()
+        assert built == ["closing", "closed"]
+        container.shutdown()
+
+    def test_cleanup_runs_once_per_object_cached_under_several_keys(self):
+        """An instance cached under two keys is cleaned up once."""
+        calls = []
+
+        class Shared:
+            @cleanup
+            def close(self):
+                calls.append(self)
+
+        shared = Shared()
+        caches = ScopedCaches()
+        container = PicoContainer(ComponentFactory(), caches, ScopeManager())
+        caches.for_scope(container.scopes, "singleton").put("a", shared)
+        caches.for_scope(container.scopes, "singleton").put("b", shared)
+        container.cleanup_all()
+        assert calls == [shared]
+        container.shutdown()
+
+
+class TestIsAwaitable:
+    """Test the type-based awaitable check used on the resolution path."""
+
+    def test_matches_inspect_isawaitable(self):
+        """Agrees with inspect.isawaitable for coroutines, futures and plain values."""
+        import types
+
+        from pico_ioc.container_resolution import _is_awaitable
+
+        async def coro_fn():
+            return 1
+
+        @types.coroutine
+        def legacy():
+            yield
+
+        def plain_gen():
+            yield
+
+        coro = coro_fn()
+        loop = asyncio.new_event_loop()
+        try:
+            fut = loop.create_future()
+            samples = [coro, legacy(), plain_gen(), fut, object(), 42, None]
+            for obj in samples:
+                assert _is_awaitable(obj) == inspect.isawaitable(obj)
+        finally:
+            coro.close()
+            loop.close()
+
+
+class TestAsyncInitCache:
+    """Test the per-class __ainit__ detection cache."""
+
+    def test_has_async_init_is_cached_per_class(self):
+        """Only async __ainit__ counts, and the answer is cached per class."""
+        from pico_ioc.container_resolution import _has_async_init
+
+        class Plain:
+            pass
+
+        class SyncInit:
+            def __ainit__(self):
+                pass
+
+        class AsyncInit:
+            async def __ainit__(self):
+                pass
+
+        assert _has_async_init(Plain) is False
+        assert _has_async_init(SyncInit) is False
+        assert _has_async_init(AsyncInit) is True
+        assert _has_async_init(AsyncInit) is True
+
+    @pytest.mark.asyncio
+    async def test_instance_level_ainit_still_runs(self):
+        """An async __ainit__ assigned in __init__ is honoured even though the class has none."""
+        calls = []
+
+        class Late:
+            def __init__(self):
+                async def ainit():
+                    calls.append("ainit")
+
+                self.__ainit__ = ainit
+
+        container = PicoContainer(ComponentFactory(), ScopedCaches(), ScopeManager())
+        try:
+            pending = container.build_class(Late, None, ())
+            assert inspect.isawaitable(pending)
+            inst = await pending
+            assert isinstance(inst, Late)
+            assert calls == ["ainit"]
+            assert isinstance(container.build_class(CachedService, None, ()), CachedService)
+        finally:
+            container.shutdown()
+
+
+class TestInterceptedClassCache:
+    """Test the per-class interceptor presence cache."""
+
+    def test_has_interceptors_is_cached_per_class(self):
+        """Classes are scanned once; inherited intercepted methods count."""
+        from pico_ioc.aop import intercepted_by
+        from pico_ioc.container_resolution import _has_interceptors
+
+        class Noop:
+            def invoke(self, ctx, call_next):
+                return call_next(ctx)
+
+        class Plain:
+            def run(self):
+                pass
+
+        class Advised:
+            @intercepted_by(Noop)
+            def run(self):
+                pass
+
+        class Child(Advised):
+            pass
+
+        class Overriding(Advised):
+            def run(self):
+                pass
+
+        class StaticAdvised:
+            @staticmethod
+            @intercepted_by(Noop)
+            def run():
+                pass
+
+        assert _has_interceptors(Plain) is False
+        assert _has_interceptors(Child) is True
+        assert _has_interceptors(Overriding) is False
+        assert _has_interceptors(StaticAdvised) is True
+
+    def test_non_function_attributes_are_ignored(self):
+        """Only functions count; other attributes carrying the marker do not."""
+        from pico_ioc.container_resolution import _has_interceptors
+
+        class Marked:
+            _pico_interceptors_ = ("x",)
+
+        class Holder:
+            nested = Marked
+            value = Marked()
+
+        assert _has_interceptors(Holder) is False
+
 
 class TestContainerStats:
     """Test container statistics."""
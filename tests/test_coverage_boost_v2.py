@@ -202,7 +202,7 @@ class TestAsyncAinit:
                 raise TypeError("simulated failure")
             return original_analyze(fn)
 
-        with patch("pico_ioc.container_resolution.analyze_callable_dependencies", patched_analyze):
+        with patch("pico_ioc.container_resolution._analyze_cached", patched_analyze):
             fact.bind(WeirdAinit, lambda: c.build_class(WeirdAinit, locator, deps))
             inst = await c.aget(WeirdAinit)
             assert inst.called is True
@@ -857,8 +857,8 @@ class TestProtocolFallback:
         assert result.provided_type is FriendlyGreeter
 
 
-class TestShouldSkipComponent:
-    """Lines 77-82: component with object.__init__ skipped."""
+class TestSkipValidation:
+    """ProviderMetadata.skip_validation: a component with object.__init__ is skipped."""
 
     def test_component_with_object_init_is_skipped(self):
         class NoInit:
@@ -878,11 +878,7 @@ class TestShouldSkipComponent:
             scope=SCOPE_SINGLETON,
         )
 
-        factory = ComponentFactory()
-        locator = ComponentLocator({NoInit: md}, {})
-        validator = DependencyValidator({NoInit: md}, factory, locator)
-
-        assert validator._should_skip_component(md) is True
+        assert md.skip_validation is True
 
     def test_component_with_custom_init_not_skipped(self):
         class HasInit:
@@ -904,11 +900,7 @@ class TestShouldSkipComponent:
             dependencies=(DependencyRequest(parameter_name="x", key=int),),
         )
 
-        factory = ComponentFactory()
-        locator = ComponentLocator({HasInit: md}, {})
-        validator = DependencyValidator({HasInit: md}, factory, locator)
-
-        assert validator._should_skip_component(md) is False
+        assert md.skip_validation is False
 
 
 # ============================================================
@@ -1244,6 +1236,66 @@ class TestResolveSingleDepFallbackPaths:
         assert "missing_dep" not in kwargs
         c.shutdown()
 
+    def test_single_dep_missing_provider_does_not_call_get(self):
+        """Missing optional providers are settled by has() lookups alone."""
+        c = PicoContainer(ComponentFactory(), ScopedCaches(), ScopeManager())
+        c.attach_locator(ComponentLocator({}, {}))
+
+        dep_req = DependencyRequest(parameter_name="missing_dep", key=float, is_optional=True)
+        kwargs = {}
+        with patch.object(c, "get", side_effect=AssertionError("get() called")):
+            c._resolve_single_dep(dep_req, kwargs)
+        assert kwargs == {}
+        c.shutdown()
+
+    def test_single_dep_bound_key_skips_container_has(self):
+        """A key bound in the factory is resolved without the full has() probe."""
+        fact = ComponentFactory()
+        fact.bind(float, lambda: 1.5)
+        c = PicoContainer(fact, ScopedCaches(), ScopeManager())
+        c.attach_locator(ComponentLocator({}, {}))
+
+        kwargs = {}
+        with patch.object(c, "has", side_effect=AssertionError("has() called")):
+            c._resolve_single_dep(DependencyRequest(parameter_name="x", key=float), kwargs)
+        assert kwargs == {"x": 1.5}
+        c.shutdown()
+
+    def test_single_dep_missing_required_raises_provider_not_found(self):
+        """A required dependency with no provider raises ProviderNotFoundError."""
+        from pico_ioc.exceptions import ProviderNotFoundError
+
+        c = PicoContainer(ComponentFactory(), ScopedCaches(), ScopeManager())
+        c.attach_locator(ComponentLocator({}, {}))
+
+        with pytest.raises(ProviderNotFoundError, match="float"):
+            c._resolve_single_dep(DependencyRequest(parameter_name="x", key=float), {})
+        c.shutdown()
+
+    def test_single_dep_optional_on_inactive_scope_uses_default(self):
+        """An optional dep on a request-scoped component outside its scope gets the default."""
+        from typing import Optional
+
+        mod = types.ModuleType("mod_optional_inactive_scope")
+
+        @component(scope="request")
+        class RequestThing:
+            pass
+
+        @component(scope="prototype")
+        class Consumer:
+            def __init__(self, thing: Optional[RequestThing] = None):
+                self.thing = thing
+
+        mod.RequestThing = RequestThing
+        mod.Consumer = Consumer
+
+        c = init(modules=[mod])
+        try:
+            assert c.get(Consumer).thing is None
+        finally:
+            c.shutdown()
+
     def test_single_dep_optional_string_key_no_provider_leaves_kwargs_unset(self):
         """Same path but with a string `key` equal to parameter_name."""
         fact = ComponentFactory()
@@ -1512,6 +1564,35 @@ class TestDependencyValidatorEdges:
 
         assert _skip_type(Proto) is True
 
+    def test_is_protocol_cache_cleared_after_validation(self):
+        from pico_ioc.dependency_validator import _is_protocol
+
+        class Proto:
+            _is_protocol = True
+
+        assert _is_protocol(Proto) is True
+        assert _is_protocol.cache_info().currsize >= 1
+
+        DependencyValidator({}, ComponentFactory(), ComponentLocator({}, {})).validate_bindings()
+        assert _is_protocol.cache_info().currsize == 0
+
+    def test_skip_type_plain_class(self):
+        from pico_ioc.dependency_validator import _skip_type
+
+        class Plain:
+            pass
+
+        assert _skip_type(Plain) is False
+
+    def test_validate_list_dep_skipped_type_does_not_collect(self):
+        """A qualified List of a skipped type never queries the locator."""
+        locator = MagicMock()
+        validator = DependencyValidator({}, ComponentFactory(), locator)
+        dep = DependencyRequest(parameter_name="xs", key=str, is_list=True, qualifier="q")
+
+        assert validator._validate_list_dep("consumer", dep, "component consumer") is None
+        locator.collect_by_type.assert_not_called()
+
     def test_validate_list_dep_no_qualifier(self):
         """List dep without qualifier returns None (no error)."""
         md = ProviderMetadata(
@@ -1544,6 +1625,88 @@ class TestDependencyValidatorEdges:
         assert result is not None
         assert "missing_key" in result
 
+    def test_validate_str_dep_matches_names_without_locator_scan(self):
+        """String deps match keys, pico names and type names from one precomputed set."""
+
+        class Mailer:
+            pass
+
+        md = ProviderMetadata(
+            key=Mailer,
+            provided_type=Mailer,
+            concrete_class=Mailer,
+            factory_class=None,
+            factory_method=None,
+            qualifiers=set(),
+            primary=False,
+            lazy=False,
+            infra="component",
+            pico_name="mailer",
+            scope=SCOPE_SINGLETON,
+        )
+        fact = ComponentFactory()
+        fact.bind("bound_only", lambda: 1)
+        locator = MagicMock()
+        validator = DependencyValidator({Mailer: md}, fact, locator)
+
+        for name in ("mailer", "Mailer", "bound_only"):
+            assert validator._validate_str_dep("svc", name, "component svc") is None
+        assert validator._validate_str_dep("svc", "nope", "component svc") is not None
+        locator.find_key_by_name.assert_not_called()
+
+    def test_validate_type_dep_not_satisfied_by_string_key_with_same_name(self):
+        """A component registered under the string key "Foo" does not provide the type Foo."""
+
+        class Foo:
+            pass
+
+        class Other:
+            pass
+
+        md = ProviderMetadata(
+            key="Foo",
+            provided_type=Other,
+            concrete_class=Other,
+            factory_class=None,
+            factory_method=None,
+            qualifiers=set(),
+            primary=False,
+            lazy=False,
+            infra="component",
+            pico_name=None,
+            scope=SCOPE_SINGLETON,
+        )
+        validator = DependencyValidator({"Foo": md}, ComponentFactory(), ComponentLocator({"Foo": md}, {}))
+
+        assert validator._validate_type_dep("svc", Foo, "component svc") is not None
+        assert validator._validate_str_dep("svc", "Foo", "component svc") is None
+
+    def test_validate_type_dep_falls_back_to_name_without_locator_scan(self):
+        """An unbound type is accepted when a provider is registered under its name."""
+
+        class Cache:
+            pass
+
+        md = ProviderMetadata(
+            key="cache",
+            provided_type=None,
+            concrete_class=None,
+            factory_class=None,
+            factory_method=None,
+            qualifiers=set(),
+            primary=False,
+            lazy=False,
+            infra="provides",
+            pico_name="Cache",
+            scope=SCOPE_SINGLETON,
+        )
+        locator = MagicMock()
+        locator.subtype_keys.return_value = ()
+        validator = DependencyValidator({"cache": md}, ComponentFactory(), locator)
+
+        assert validator._validate_type_dep("svc", Cache, "component svc") is None
+        locator.find_key_by_name.assert_not_called()
+
     def test_validate_type_dep_found_by_md(self):
         """Type dep found through _find_md_for_type."""
 
@@ -1870,6 +2033,86 @@ class TestDependencyValidatorMore:
         result = validator._find_md_for_type(WeirdType)
         assert result is None or isinstance(result, ProviderMetadata)
 
+    def test_find_md_for_type_stops_at_first_primary(self):
+        """A primary match wins over earlier ones and ends the scan."""
+        checked = []
+
+        class CountingMeta(type):
+            def __subclasscheck__(cls, subclass):
+                checked.append(subclass)
+                return type.__subclasscheck__(cls, subclass)
+
+        class Port(metaclass=CountingMeta):
+            pass
+
+        class First(Port):
+            pass
+
+        class Primary(Port):
+            pass
+
+        class Unrelated:
+            pass
+
+        def make_md(cls, primary):
+            return ProviderMetadata(
+                key=cls,
+                provided_type=cls,
+                concrete_class=cls,
+                factory_class=None,
+                factory_method=None,
+                qualifiers=set(),
+                primary=primary,
+                lazy=False,
+                infra="component",
+                pico_name=None,
+                scope=SCOPE_SINGLETON,
+            )
+
+        metadata = {cls: make_md(cls, cls is Primary) for cls in (First, Primary, Unrelated)}
+        validator = DependencyValidator(metadata, ComponentFactory(), ComponentLocator(metadata, {}))
+
+        assert validator._find_md_for_type(Port) is metadata[Primary]
+        assert Unrelated not in checked
+
+        del metadata[Primary]
+        assert validator._find_md_for_type(Port) is metadata[First]
+
+    def test_find_md_for_type_plain_class_uses_supertype_index(self):
+        """Plain-class lookups go through the locator's reverse MRO index."""
+
+        class Base:
+            pass
+
+        class Impl(Base):
+            pass
+
+        class PrimaryImpl(Base):
+            pass
+
+        metadata = {
+            cls: ProviderMetadata(
+                key=cls,
+                provided_type=cls,
+                concrete_class=cls,
+                factory_class=None,
+                factory_method=None,
+                qualifiers=set(),
+                primary=cls is PrimaryImpl,
+                lazy=False,
+                infra="component",
+                pico_name=None,
+                scope=SCOPE_SINGLETON,
+            )
+            for cls in (Impl, PrimaryImpl)
+        }
+        locator = ComponentLocator(metadata, {})
+        validator = DependencyValidator(metadata, ComponentFactory(), locator)
+
+        assert validator._find_md_for_type(Base) is metadata[PrimaryImpl]
+        assert locator._by_supertype is not None
+        assert validator._find_md_for_type(int) is None
+
     def test_should_skip_configuration(self):
         """Line 77-78: infra='configuration' is skipped."""
         md = ProviderMetadata(
@@ -1885,10 +2128,7 @@ class TestDependencyValidatorMore:
             pico_name=None,
             scope=SCOPE_SINGLETON,
         )
-        fact = ComponentFactory()
-        locator = ComponentLocator({}, {})
-        validator = DependencyValidator({}, fact, locator)
-        assert validator._should_skip_component(md) is True
+        assert md.skip_validation is True
 
     def test_should_skip_no_deps_other_infra(self):
         """Line 79-80: no deps, infra not configured/component, no override -> skip."""
@@ -1906,10 +2146,7 @@ class TestDependencyValidatorMore:
             scope=SCOPE_SINGLETON,
             dependencies=(),
         )
-        fact = ComponentFactory()
-        locator = ComponentLocator({}, {})
-        validator = DependencyValidator({}, fact, locator)
-        assert validator._should_skip_component(md) is True
+        assert md.skip_validation is True
 
     def test_validate_list_dep_with_qualifier_missing(self):
         """Line 108: qualified list dep with no matching components."""
@@ -2175,6 +2412,22 @@ class TestAnalysisNoAnnotation:
         assert deps[0].key is Any
 
 
+class TestAnalysisCachedLifecycleMethods:
+    """analysis._analyze_cached: lifecycle methods are analyzed once per function."""
+
+    def test_bound_methods_share_one_analysis(self):
+        """Two instances' bound methods reuse the analysis of the function."""
+        from pico_ioc.analysis import _analyze_cached
+
+        class Service:
+            def setup(self, dep: int):
+                pass
+
+        first = _analyze_cached(Service().setup)
+        assert first is _analyze_cached(Service().setup)
+        assert [d.parameter_name for d in first] == ["dep"]
+
+
 class TestDecoratorsProvidesNoReturnType:
     """decorators.py line 258: @provides sin return annotation -> key=nombre."""
 
@@ -2248,6 +2501,57 @@ class TestDecoratorsGetReturnTypeFailure:
             result = get_return_type(func)
             assert result is MyClass
 
+    def test_get_return_type_is_cached_on_the_function(self):
+        """Resolved hints are cached; unannotated returns skip get_type_hints."""
+        from pico_ioc.decorators import get_return_type
+
+        class MyClass:
+            pass
+
+        def func() -> MyClass:
+            pass
+
+        def bare():
+            pass
+
+        assert get_return_type(func) is MyClass
+        with patch("pico_ioc.decorators.typing.get_type_hints", side_effect=AssertionError("re-resolved")):
+            assert get_return_type(func) is MyClass
+            assert get_return_type(bare) is None
+
+    def test_get_return_type_reads_plain_class_annotations_directly(self):
+        """Plain class annotations skip get_type_hints; string ones still resolve."""
+        from pico_ioc.decorators import get_return_type
+
+        class MyClass:
+            pass
+
+        def plain() -> MyClass:
+            pass
+
+        def quoted() -> "MyClass":
+            pass
+
+        with patch("pico_ioc.decorators.typing.get_type_hints", side_effect=AssertionError("evaluated")):
+            assert get_return_type(plain) is MyClass
+        with patch("pico_ioc.decorators.typing.get_type_hints", return_value={"return": MyClass}) as hints:
+            assert get_return_type(quoted) is MyClass
+        hints.assert_called_once()
+
+    def test_get_return_type_does_not_cache_unresolved_forward_refs(self):
+        """A forward reference that fails now is resolved on a later call."""
+        from pico_ioc.decorators import get_return_type
+
+        ns = {}
+        exec("def func() -> 'LaterDefined':\n    pass", ns)
+        assert get_return_type(ns["func"]) is None
+
+        class LaterDefined:
+            pass
+
+        ns["LaterDefined"] = LaterDefined
+        assert get_return_type(ns["func"]) is LaterDefined
+
 
 class TestDecoratorsConfiguredInvalidMapping:
     """decorators.py line 393: @configured con mapping inválido."""
@@ -2257,6 +2561,37 @@ class TestDecoratorsConfiguredInvalidMapping:
             configured(mapping="invalid")
 
 
+class TestDecoratorsMarkedMethodNames:
+    """decorators._marked_method_names: cached per-class lifecycle method lookup."""
+
+    def test_inherited_and_overridden_methods(self):
+        """Inherited marked methods are found; unmarked overrides hide them."""
+        from pico_ioc import cleanup, health
+        from pico_ioc.decorators import _marked_method_names
+
+        class Base:
+            @cleanup
+            def close(self):
+                pass
+
+            @cleanup
+            def release(self):
+                pass
+
+        class Child(Base):
+            def release(self):
+                pass
+
+            @health
+            def ok(self):
+                return True
+
+        assert _marked_method_names(Base, "cleanup") == ("close", "release")
+        assert _marked_method_names(Child, "cleanup") == ("close",)
+        assert _marked_method_names(Child, "health_check") == ("ok",)
+        assert _marked_method_names(Child, "cleanup") is _marked_method_names(Child, "cleanup")
+
+
 class TestAopScopeSignatureNonSingleton:
     """aop.py lines 343-345: _scope_signature para scopes no-singleton."""
 
@@ -2450,6 +2785,28 @@ class TestComponentScannerConditionalPredicate:
         assert scanner._enabled_by_condition(BadComponent) is False
 
 
+class TestComponentScannerQualifierMetadata:
+    """Qualifiers are normalised to plain strings once, at decoration time."""
+
+    def test_qualifier_objects_stored_and_indexed_as_str(self):
+        from pico_ioc import Qualifier
+        from pico_ioc.component_scanner import ComponentScanner
+
+        @component(qualifiers=[Qualifier("fast"), "db"])
+        class Qualified:
+            pass
+
+        stored = getattr(Qualified, PICO_META)["qualifier"]
+        assert stored == ("fast", "db")
+        assert all(type(q) is str for q in stored)
+
+        scanner = ComponentScanner(profiles=set(), environ={}, config_manager=None)
+        scanner._register_component_class(Qualified)
+        candidates, _, _, _ = scanner.get_scan_results()
+        _, _, md = candidates[Qualified][0]
+        assert md.qualifiers == {"fast", "db"}
+
+
 class TestConfigRuntimeGetTypeHintsFailure:
     """config_runtime.py lines 284-285, 301-302: get_type_hints falla."""
 
@@ -2599,6 +2956,23 @@ class TestProxyProtocolsOperators:
 
         return SimpleProxy(value)
 
+    def test_generated_forwarders_are_named_and_delegate(self):
+        from pico_ioc.proxy_protocols import _ProxyProtocolMixin
+
+        assert _ProxyProtocolMixin.__add__.__name__ == "__add__"
+        assert _ProxyProtocolMixin.__radd__.__qualname__ == "_ProxyProtocolMixin.__radd__"
+
+        proxy = self._make_proxy([3, 1, 2])
+        assert len(proxy) == 3
+        assert proxy[0] == 3
+        assert 2 in proxy
+        assert list(reversed(proxy)) == [2, 1, 3]
+        assert [0] + proxy == [0, 3, 1, 2]
+        assert proxy == [3, 1, 2]
+        assert str(proxy) == "[3, 1, 2]"
+        del proxy[0]
+        assert proxy[0] == 1
+
     def test_rfloordiv(self):
         """Line 97: __rfloordiv__"""
         proxy = self._make_proxy(3)
@@ -2647,17 +3021,47 @@ class TestScopeManagerActivateNoActivateMethod:
         assert result is None
 
 
-class TestScopedCachesCleanupObjectInspectError:
-    def test_cleanup_object_inspect_error(self):
-        """Lines 189-190: inspect.getmembers fails on object."""
-        caches = ScopedCaches()
+class TestScopedCachesCleanupObject:
+    def test_cleanup_object_runs_hooks_through_proxy(self):
+        """@cleanup methods are found on the component class behind a proxy."""
+        from pico_ioc import cleanup
+        from pico_ioc.aop import UnifiedComponentProxy
 
-        class Explosive:
-            def __dir__(self):
-                raise RuntimeError("can't inspect")
+        closed = []
 
-        # Should not raise - error is logged
-        caches._cleanup_object(Explosive())
+        class Session:
+            @cleanup
+            def close(self):
+                closed.append("closed")
+
+        proxy = UnifiedComponentProxy(container=MagicMock(spec=[]), target=Session())
+        ScopedCaches()._cleanup_object(proxy)
+        assert closed == ["closed"]
+
+    def test_cleanup_object_skips_class_without_cleanup_methods(self):
+        """Objects whose class has no @cleanup methods are not touched."""
+        touched = []
+
+        class Plain:
+            def close(self):
+                touched.append("close")
+
+            def __getattr__(self, name):
+                touched.append(name)
+                raise AttributeError(name)
+
+        ScopedCaches()._cleanup_object(Plain())
+        assert touched == []
+
+    def test_cleanup_object_logs_when_class_lookup_fails(self):
+        """A lazy proxy whose target cannot be created is logged, not raised."""
+        from pico_ioc.aop import UnifiedComponentProxy
+
+        def creator():
+            raise RuntimeError("cannot build")
+
+        proxy = UnifiedComponentProxy(container=MagicMock(spec=[]), object_creator=creator)
+        ScopedCaches()._cleanup_object(proxy)
 
     def test_cleanup_container_error(self):
         """Lines 202-203: container.items() raises exception."""
@@ -2705,21 +3109,65 @@ class TestFactoryConditionFalse:
         assert MyFactory not in [md.factory_class for _, _, md in results[0].get(MyFactory, [])]
 
 
-class TestDetectFactoryDepsException:
-    def test_detect_factory_deps_attribute_error(self):
-        """Lines 171-172: exception during attribute inspection in _detect_factory_deps."""
+class TestFactoryClassRaisingAttribute:
+    def test_register_factory_class_ignores_raising_attribute(self):
+        """An attribute that raises on access does not stop factory registration."""
+        from pico_ioc import factory, provides
         from pico_ioc.component_scanner import ComponentScanner
 
-        mgr = ConfigurationManager(None)
-        scanner = ComponentScanner(set(), {}, mgr)
+        class Built:
+            pass
 
+        @factory()
         class TrickyFactory:
             @property
             def problematic(self):
                 raise AttributeError("boom")
 
-        result = scanner._detect_factory_deps(TrickyFactory)
-        assert result is None
+            @provides(Built)
+            def build(self) -> Built:
+                return Built()
+
+        scanner = ComponentScanner(set(), {}, ConfigurationManager(None))
+        scanner._register_factory_class(TrickyFactory)
+        assert Built in scanner.get_scan_results()[0]
+
+
+class TestFactoryClassSinglePass:
+    def test_constructor_deps_analysed_only_for_enabled_instance_provides(self):
+        """__init__ is not analysed when every instance @provides is disabled."""
+        from pico_ioc import factory, provides
+        from pico_ioc.component_scanner import ComponentScanner
+
+        class Built:
+            pass
+
+        class Skipped:
+            pass
+
+        @factory()
+        class StaticOnly:
+            def __init__(self, missing: int):
+                pass
+
+            @staticmethod
+            @provides(Built)
+            def build() -> Built:
+                return Built()
+
+            @provides(Skipped, conditional_profiles=("prod",))
+            def build_skipped(self) -> Skipped:
+                return Skipped()
+
+        scanner = ComponentScanner(set(), {}, ConfigurationManager(None))
+        with patch(
+            "pico_ioc.component_scanner.analyze_callable_dependencies", wraps=analyze_callable_dependencies
+        ) as spy:
+            scanner._register_factory_class(StaticOnly)
+        analysed = [c.args[0] for c in spy.call_args_list]
+        assert StaticOnly.__init__ not in analysed
+        assert Built in scanner.get_scan_results()[0]
+        assert Skipped not in scanner.get_scan_results()[0]
 
 
 class TestResolveProvidesMemberClassmethod:
@@ -2798,6 +3246,142 @@ class TestCanBeSelectedForNonType:
         assert result is False
 
 
+class TestRegistrarFinalizeIndexes:
+    def test_indexes_built_once_and_cover_on_missing_defaults(self):
+        """finalize builds the indexes in one pass, after on_missing defaults are added."""
+        from pico_ioc.registrar import Registrar
+
+        class Port:
+            pass
+
+        @component(name="fallback_port", on_missing_selector=Port)
+        class DefaultPort(Port):
+            pass
+
+        mod = types.ModuleType("mod_on_missing_index")
+        mod.DefaultPort = DefaultPort
+        with patch.object(Registrar, "_rebuild_indexes", autospec=True, side_effect=Registrar._rebuild_indexes) as spy:
+            pico = init(modules=[mod])
+        try:
+            assert spy.call_count == 1
+            assert isinstance(pico.get(Port), DefaultPort)
+            assert Port in pico._locator._indexes["pico_name"]["fallback_port"]
+        finally:
+            pico.shutdown()
+
+    def test_on_missing_highest_priority_then_scan_order(self):
+        """on_missing defaults apply by descending priority, ties in scan order."""
+
+        class Port:
+            pass
+
+        class Other:
+            pass
+
+        @component(on_missing_selector=Port, on_missing_priority=1)
+        class ALow(Port):
+            pass
+
+        @component(on_missing_selector=Port, on_missing_priority=5)
+        class BHigh(Port):
+            pass
+
+        @component(on_missing_selector=Other)
+        class CFirst(Other):
+            pass
+
+        @component(on_missing_selector=Other)
+        class DSecond(Other):
+            pass
+
+        mod = types.ModuleType("mod_on_missing_order")
+        for c in (ALow, BHigh, CFirst, DSecond):
+            setattr(mod, c.__name__, c)
+        pico = init(modules=[mod])
+        try:
+            assert isinstance(pico.get(Port), BHigh)
+            assert isinstance(pico.get(Other), CFirst)
+        finally:
+            pico.shutdown()
+
+    def test_on_missing_priority_normalised_at_decoration(self):
+        """The scanner queues the int priority stored by the decorator as-is."""
+        from pico_ioc.component_scanner import ComponentScanner
+
+        class Port:
+            pass
+
+        @component(on_missing_selector=Port, on_missing_priority="3")
+        class Fallback(Port):
+            pass
+
+        assert getattr(Fallback, PICO_META)["on_missing"]["priority"] == 3
+        scanner = ComponentScanner(profiles=set(), environ={}, config_manager=None)
+        scanner._scan_class(Fallback)
+        _, on_missing, _, _ = scanner.get_scan_results()
+        assert on_missing == [(3, Port, Fallback)]
+
+    def test_scope_promotion_skipped_when_everything_is_singleton(self):
+        """No dependency type scans happen when no provider has a narrower scope."""
+        from pico_ioc.registrar import Registrar
+
+        class Dep:
+            pass
+
+        @component()
+        class Uses:
+            def __init__(self, dep: Dep):
+                self.dep = dep
+
+        mod = types.ModuleType("mod_all_singletons")
+        mod.Dep = component()(Dep)
+        mod.Uses = Uses
+        with patch.object(Registrar, "_find_narrower_scope_from_deps") as spy:
+            pico = init(modules=[mod])
+        try:
+            spy.assert_not_called()
+            assert isinstance(pico.get(Uses).dep, Dep)
+        finally:
+            pico.shutdown()
+
+
+class TestProviderSelector:
+    def _md(self, name, primary=False):
+        return ProviderMetadata(
+            key="svc",
+            provided_type=None,
+            concrete_class=None,
+            factory_class=None,
+            factory_method=None,
+            qualifiers=set(),
+            primary=primary,
+            lazy=False,
+            infra="component",
+            pico_name=name,
+        )
+
+    def test_single_candidate_is_not_ranked(self):
+        """A lone candidate is chosen without consulting the config manager."""
+        from pico_ioc.provider_selector import ProviderSelector
+
+        mgr = MagicMock(spec=ConfigurationManager)
+        md = self._md("svc")
+        winners = ProviderSelector(mgr).select_providers({"svc": [(False, "p", md)]})
+        assert winners == {"svc": ("p", md)}
+        mgr.prefix_exists.assert_not_called()
+
+    def test_ties_keep_first_registered_candidate(self):
+        """Among equally ranked candidates the first one wins."""
+        from pico_ioc.provider_selector import ProviderSelector
+
+        first, second, prim = self._md("ab"), self._md("cd"), self._md("x", primary=True)
+        sel = ProviderSelector(ConfigurationManager(None))
+        winners = sel.select_providers({"svc": [(False, "p1", first), (False, "p2", second)]})
+        assert winners["svc"] == ("p1", first)
+        winners = sel.select_providers({"svc": [(False, "p1", first), (True, "p3", prim)]})
+        assert winners["svc"] == ("p1", first)
+
+
 # ============================================================
 # Extra coverage: analysis.py
 # ============================================================
@@ -3071,6 +3655,44 @@ class TestDependencyValidatorProtocolFallback:
         assert result is not None
 
 
+class TestValidateBindingsDedupesErrors:
+    def test_same_missing_dependency_reported_once(self):
+        class Missing:
+            pass
+
+        class Consumer:
+            def __init__(self, a: Missing, b: Missing, name: str, c: Optional[Missing] = None):
+                pass
+
+        md = ProviderMetadata(
+            key=Consumer,
+            provided_type=Consumer,
+            concrete_class=Consumer,
+            factory_class=None,
+            factory_method=None,
+            qualifiers=set(),
+            primary=False,
+            lazy=False,
+            infra="component",
+            pico_name=None,
+            scope=SCOPE_SINGLETON,
+            dependencies=(
+                DependencyRequest(parameter_name="a", key=Missing),
+                DependencyRequest(parameter_name="b", key=Missing),
+                DependencyRequest(parameter_name="name", key=str),
+                DependencyRequest(parameter_name="c", key=Missing, is_optional=True),
+            ),
+        )
+        metadata = {Consumer: md}
+        validator = DependencyValidator(metadata, ComponentFactory(), ComponentLocator(metadata, {}))
+
+        with pytest.raises(InvalidBindingError) as exc:
+            validator.validate_bindings()
+
+        assert len(exc.value.errors) == 1
+        assert "Missing" in exc.value.errors[0]
+
+
 class TestValidateTypeDepReturnError:
     def test_unbound_type_dep_returns_error_msg(self):
         """Line 124: _validate_type_dep returns error for unbound type."""
@@ -135,3 +135,29 @@ def test_auto_subscriber_mixin():
     s._pico_autosubscribe(bus)
     bus.publish_sync(MyEvent(7))
     assert seen == [7]
+
+
+def test_autosubscribe_does_not_evaluate_properties_and_honours_overrides():
+    seen: List[str] = []
+
+    class Base(AutoSubscriberMixin):
+        @subscribe(MyEvent)
+        def on_base(self, evt: MyEvent):
+            seen.append("base")
+
+        @subscribe(MyEvent)
+        def on_overridden(self, evt: MyEvent):
+            seen.append("base-overridden")
+
+    class S(Base):
+        @property
+        def boom(self):
+            raise AssertionError("property evaluated")
+
+        def on_overridden(self, evt: MyEvent):
+            seen.append("child-overridden")
+
+    bus = EventBus()
+    S()._pico_autosubscribe(bus)
+    bus.publish_sync(MyEvent(1))
+    assert seen == ["base"]
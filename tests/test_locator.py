@@ -167,6 +167,41 @@ def test_collect_by_type_edge_cases():
     assert results == ["key3"]
 
 
+def test_collect_by_type_memoizes_protocol_probe(monkeypatch):
+    class PlainProtocol(Protocol):
+        def do_something(self): ...
+
+    metadata = {
+        name: ProviderMetadata(
+            key=name,
+            provided_type=typ,
+            concrete_class=typ,
+            factory_class=None,
+            factory_method=None,
+            qualifiers=set(),
+            primary=False,
+            lazy=False,
+            infra="test",
+            pico_name=None,
+        )
+        for name, typ in (("impl", ImplementsProto), ("other", NotProto))
+    }
+    loc = ComponentLocator(metadata, {})
+    calls = []
+    original = ComponentLocator._implements_protocol
+
+    def counting(typ, proto):
+        calls.append(typ)
+        return original(typ, proto)
+
+    monkeypatch.setattr(ComponentLocator, "_implements_protocol", staticmethod(counting))
+
+    assert loc.collect_by_type(PlainProtocol, None) == ["impl"]
+    assert loc.collect_by_type(PlainProtocol, None) == ["impl"]
+    assert loc.by_key_type(str).collect_by_type(PlainProtocol, None) == ["impl"]
+    assert calls == [ImplementsProto, NotProto]
+
+
 def test_find_key_by_name_fallback(complex_locator):
     assert complex_locator.find_key_by_name("service_a") == MyService
 
@@ -174,3 +209,65 @@ def test_find_key_by_name_fallback(complex_locator):
     assert found_key == MyService
 
     assert complex_locator.find_key_by_name("NonExistent") is None
+
+
+def test_is_subclass_matches_issubclass_for_plain_and_abc_bases():
+    from abc import ABC
+
+    from pico_ioc.locator import _is_subclass
+
+    class Plain:
+        pass
+
+    class Sub(Plain):
+        pass
+
+    class Virtual(ABC):
+        pass
+
+    Virtual.register(MyService)
+
+    assert _is_subclass(Sub, Plain)
+    assert not _is_subclass(Plain, Sub)
+    assert _is_subclass(MyService, Virtual)
+    assert not _is_subclass(Sub, Virtual)
+
+
+def test_subtype_keys_and_pico_name_index(complex_locator):
+    assert complex_locator.subtype_keys(MyService) == (MyService,)
+    assert complex_locator.subtype_keys(object) == tuple(complex_locator._metadata)
+    assert complex_locator.subtype_keys(MyProtocol) == ()
+    assert all(type(keys) is tuple for keys in complex_locator._supertype_index().values())
+    assert complex_locator.key_for_pico_name("factory_b") == "string_key"
+    assert complex_locator.key_for_pico_name("missing") is None
+
+
+def test_metadata_effective_type_prefers_provided_type(make_metadata):
+    assert make_metadata("k", provided_type=int, concrete_class=str).effective_type is int
+    assert make_metadata("k", concrete_class=str).effective_type is str
+    assert make_metadata("k").effective_type is None
+
+
+def test_metadata_effective_type_recomputed_on_replace_and_ignored_in_equality(make_metadata):
+    import dataclasses
+
+    md = make_metadata("k", concrete_class=str)
+    replaced = dataclasses.replace(md, provided_type=int)
+    assert replaced.effective_type is int
+    assert md == make_metadata("k", concrete_class=str)
+
+
+def test_metadata_skip_validation_precomputed(make_metadata):
+    import dataclasses
+
+    class NoInit:
+        pass
+
+    class WithInit:
+        def __init__(self, x: int):
+            pass
+
+    assert make_metadata("k", concrete_class=NoInit).skip_validation is True
+    assert make_metadata("k", concrete_class=WithInit).skip_validation is False
+    configuration = dataclasses.replace(make_metadata("k", concrete_class=WithInit), infra="configuration")
+    assert configuration.skip_validation is True
@@ -67,3 +67,32 @@ def test_cycle_detected(n):
     with pytest.raises(InvalidBindingError) as e:
         init(mod)
     assert "Circular dependency detected" in str(e.value)
+
+
+def test_find_cycle_handles_deep_chains_without_recursion():
+    from pico_ioc.api import _find_cycle
+
+    depth = 5000
+    graph = {i: (i + 1,) for i in range(depth)}
+    assert _find_cycle(graph) is None
+    graph[depth] = (depth - 2,)
+    assert _find_cycle(graph) == (depth - 2, depth - 1, depth, depth - 2)
+
+
+def test_export_graph_uses_sequential_node_ids(tmp_path, make_metadata):
+    from pico_ioc.analysis import DependencyRequest
+    from pico_ioc.graph_export import export_graph
+    from pico_ioc.locator import ComponentLocator
+
+    def md(key, deps=()):
+        return make_metadata(key, dependencies=tuple(DependencyRequest(parameter_name=d, key=d) for d in deps))
+
+    metadata = {"a": md("a", ("b", "missing")), "b": md("b")}
+    path = tmp_path / "graph.dot"
+    export_graph(ComponentLocator(metadata, {}), str(path), include_scopes=False)
+
+    content = path.read_text(encoding="utf-8")
+    assert '  n0 [label="a"];' in content
+    assert '  n1 [label="b"];' in content
+    assert "  n0 -> n1;" in content
+    assert "  n0 -> n2;" in content
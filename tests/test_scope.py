@@ -1,4 +1,5 @@
 import contextvars
+from unittest.mock import patch
 
 import pytest
 
@@ -109,6 +110,35 @@ def test_custom_scope_registration():
     assert sm.get_id("tenant") is None
 
 
+def test_scope_names_cached_until_registration():
+    sm = ScopeManager()
+    before = sm.names()
+    assert sm.names() is before
+
+    sm.register_scope("tenant")
+    after = sm.names()
+    assert after == before + ("tenant",)
+    assert sm.names() is after
+
+
+def test_signature_all_tracks_activation_and_registration():
+    sm = ScopeManager()
+    assert sm.signature_all() == (None,) * len(sm.names())
+
+    token = sm.activate("session", "s-1")
+    assert sm.signature_all() == sm.signature(sm.names())
+    assert "s-1" in sm.signature_all()
+
+    sm.register_scope("tenant")
+    tenant_token = sm.activate("tenant", "t-1")
+    assert sm.signature_all() == sm.signature(sm.names())
+    assert sm.signature_all()[-1] == "t-1"
+
+    sm.deactivate("tenant", tenant_token)
+    sm.deactivate("session", token)
+    assert sm.signature_all() == (None,) * len(sm.names())
+
+
 def test_cannot_register_reserved_scopes():
     sm = ScopeManager()
     with pytest.raises(ScopeError):
@@ -139,3 +169,67 @@ def test_cleanup_triggers_lifecycle_methods():
     assert obj.cleaned is False
     caches.cleanup_scope("request", "req-1")
     assert obj.cleaned is True
+
+
+def test_builtin_scopes_created_on_first_activation():
+    sm = ScopeManager()
+    other = ScopeManager()
+    assert sm._scopes == {}
+    assert sm.get_id("request") is None
+    assert "request" in sm.names()
+
+    token = sm.activate("request", "r-1")
+    assert sm.get_id("request") == "r-1"
+    assert other.get_id("request") is None
+    sm.deactivate("request", token)
+    assert sm.get_id("request") is None
+
+
+def test_concurrent_first_activation_shares_one_builtin_scope():
+    import threading
+
+    from pico_ioc import scope as scope_module
+
+    sm = ScopeManager()
+    barrier = threading.Barrier(2)
+    activated = threading.Barrier(2)
+    results = {}
+
+    class SlowScope(ContextVarScope):
+        __slots__ = ()
+
+        def __init__(self, var):
+            super().__init__(var)
+            barrier.wait(timeout=5)
+
+    def first_activation(scope_id):
+        token = sm.activate("request", scope_id)
+        activated.wait(timeout=5)
+        seen = (sm.get_id("request"), sm.signature_all())
+        sm.deactivate("request", token)
+        results[scope_id] = seen
+
+    with patch.object(scope_module, "ContextVarScope", SlowScope):
+        threads = [threading.Thread(target=first_activation, args=(f"r-{i}",)) for i in range(2)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+    assert results["r-0"][0] == "r-0"
+    assert results["r-1"][0] == "r-1"
+    assert "r-0" in results["r-0"][1]
+    assert "r-1" in results["r-1"][1]
+
+
+def test_per_scope_objects_have_no_instance_dict():
+    import contextvars
+
+    from pico_ioc.scope import ComponentContainer
+
+    for obj in (
+        ComponentContainer(),
+        ContextVarScope(contextvars.ContextVar("pico_test_id", default=None)),
+        ScopeManager(),
+    ):
+        assert not hasattr(obj, "__dict__")
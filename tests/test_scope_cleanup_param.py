@@ -7,7 +7,7 @@ scopes (request, transaction) do not accumulate instances. With the
 default ``cleanup=False`` the cached instance survives the block.
 """
 
-from pico_ioc import cleanup, component, init
+from pico_ioc import cleanup, component, init, intercepted_by
 
 
 @component(scope="request")
@@ -24,6 +24,33 @@ class ReqScoped:
         ReqScoped.cleaned += 1
 
 
+@component
+class PassThrough:
+    def invoke(self, ctx, call_next):
+        return call_next(ctx)
+
+
+closed = []
+
+
+@component(scope="request")
+class InterceptedReqScoped:
+    @intercepted_by(PassThrough)
+    def work(self) -> str:
+        return "done"
+
+    @cleanup
+    def _close(self) -> None:
+        closed.append("closed")
+
+
+@component(scope="request", lazy=True)
+class LazyReqScoped:
+    @cleanup
+    def _close(self) -> None:
+        closed.append("lazy closed")
+
+
 def _fresh_container():
     return init(modules=[__name__])
 
@@ -57,3 +84,15 @@ def test_cleanup_false_is_default_and_preserves_instance():
             assert c.get(ReqScoped).id == first
     finally:
         c.shutdown()
+
+
+def test_cleanup_true_runs_hooks_of_proxied_components():
+    closed.clear()
+    c = _fresh_container()
+    try:
+        with c.scope("request", "r-proxy", cleanup=True):
+            assert c.get(InterceptedReqScoped).work() == "done"
+            c.get(LazyReqScoped)
+        assert sorted(closed) == ["closed", "lazy closed"]
+    finally:
+        c.shutdown()
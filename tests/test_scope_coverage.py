@@ -55,6 +55,30 @@ def test_scoped_caches_shrink():
     assert len(caches._by_scope[scope_name]) == 1
 
 
+def test_for_scope_reuses_container_per_scope_id():
+    caches = ScopedCaches()
+    manager = ScopeManager()
+
+    token = manager.activate("request", "r-1")
+    first = caches.for_scope(manager, "request")
+    assert caches.for_scope(manager, "request") is first
+    manager.deactivate("request", token)
+
+    manager.activate("request", "r-2")
+    second = caches.for_scope(manager, "request")
+    assert second is not first
+    assert list(caches._by_scope["request"]) == ["r-1", "r-2"]
+
+
+def test_scoped_caches_shrink_evicts_oldest_first():
+    caches = ScopedCaches()
+    caches._by_scope["request"] = {f"req{i}": ComponentContainer() for i in range(5)}
+
+    caches.shrink("request", 2)
+
+    assert list(caches._by_scope["request"]) == ["req3", "req4"]
+
+
 def test_cleanup_container_exceptions():
     caches = ScopedCaches()
     container = ComponentContainer()
@@ -54,3 +54,11 @@ def test_non_primary_impl_keeps_its_own_singleton():
 def test_has_resolves_base_class():
     container = _container()
     assert container.has(Base)
+
+
+def test_base_class_key_is_memoized_until_locator_reattached():
+    container = _container()
+    assert container._canonical_key(Base) is PrimaryImpl
+    assert container._canonical_cache[Base] is PrimaryImpl
+    container.attach_locator(container._locator)
+    assert Base not in container._canonical_cache